@@ -112,12 +112,20 @@ function computeBeatMap(instrs: Instruction[]): Map<string, number> {
 
 const PROTO_IDS = ProtoDancerIdSchema.options;
 
+const CARDINAL_FACING_LABELS: [Vector, string][] = [
+  [NORTH, 'up (0 rot)'],
+  [EAST, 'across-right (0.25 rot)'],
+  [SOUTH, 'down (0.5 rot)'],
+  [WEST, 'across-left (0.75 rot)'],
+];
+
 function facingStr(facing: Vector): string {
   const EPS = 0.02; // ~1° in component space
-  if (facing.subtract(NORTH).length() < EPS) return 'up (0 rot)';
-  if (facing.subtract(EAST).length() < EPS) return 'across-right (0.25 rot)';
-  if (facing.subtract(SOUTH).length() < EPS) return 'down (0.5 rot)';
-  if (facing.subtract(WEST).length() < EPS) return 'across-left (0.75 rot)';
+  for (const [dir, label] of CARDINAL_FACING_LABELS) {
+    const dx = facing.x - dir.x;
+    const dy = facing.y - dir.y;
+    if (dx * dx + dy * dy < EPS * EPS) return label;
+  }
   const rad = headingAngle(facing);
   const normalized = ((rad % (2 * Math.PI)) + 2 * Math.PI) % (2 * Math.PI);
   return `${(normalized / (2 * Math.PI)).toFixed(2)} rot`;
@@ -167,6 +175,15 @@ function formatKeyframe(kf: Keyframe): string {
   const lines: string[] = [];
   lines.push(`── Beat ${kf.beat} ──`);
 
+  // Every nearby dancer (all protos at offsets -1, 0, 1), placed once per keyframe
+  const nearby: { id: DancerId; state: DancerState }[] = [];
+  for (const otherId of PROTO_IDS) {
+    for (const offset of [-1, 0, 1]) {
+      const did = makeDancerId(otherId, offset);
+      nearby.push({ id: did, state: dancerPosition(did, kf.dancers) });
+    }
+  }
+
   for (const protoId of PROTO_IDS) {
     const d = kf.dancers[protoId];
     const dancerId = makeDancerId(protoId, 0);
@@ -181,15 +198,7 @@ function formatKeyframe(kf: Keyframe): string {
       lines.push(`  hands: (none)`);
     }
 
-    // Build list of nearby dancers (all protos at offsets -1, 0, 1)
-    const others: { id: DancerId; state: DancerState }[] = [];
-    for (const otherId of PROTO_IDS) {
-      for (const offset of [-1, 0, 1]) {
-        if (otherId === protoId && offset === 0) continue;
-        const did = makeDancerId(otherId, offset);
-        others.push({ id: did, state: dancerPosition(did, kf.dancers) });
-      }
-    }
+    const others = nearby.filter(o => o.id !== dancerId);
 
     // on left, on right, in front (relative to facing)
     const f = d.facing;
@@ -12,7 +12,7 @@ import { execSync } from 'node:child_process';
 import { mkdtempSync, writeFileSync, readFileSync, rmSync, symlinkSync } from 'node:fs';
 import { tmpdir } from 'node:os';
 import { join, resolve } from 'node:path';
-import { DanceSchema, type Keyframe } from '../src/types';
+import { DanceSchema, ProtoDancerIdSchema, type Keyframe } from '../src/types';
 import { generateAllKeyframes } from '../src/generate';
 
 const DANCE_FILE = 'example-dances/otters-allemande.json';
@@ -29,20 +29,26 @@ const ref = args[0];
 
 // --- Deterministic keyframe serialization ---
 
+const SCALE = 10 ** PRECISION;
+
 function round(n: number): number {
-  return Math.round(n * 10 ** PRECISION) / 10 ** PRECISION;
+  return Math.round(n * SCALE) / SCALE;
 }
 
+// Every keyframe has the same four dancers, so sort their ids once up front.
+const SORTED_IDS = [...ProtoDancerIdSchema.options].sort((a, b) => a.localeCompare(b));
+
 function serializeKeyframes(keyframes: Keyframe[]): string {
   const plain = keyframes.map(kf => ({
     beat: round(kf.beat),
     dancers: Object.fromEntries(
-      Object.entries(kf.dancers)
-        .sort(([a], [b]) => a.localeCompare(b))
-        .map(([id, state]) => [id, {
+      SORTED_IDS.map(id => {
+        const state = kf.dancers[id];
+        return [id, {
           pos: { x: round(state.pos.x), y: round(state.pos.y) },
           facing: { x: round(state.facing.x), y: round(state.facing.y) },
-        }])
+        }];
+      })
     ),
     hands: kf.hands
       .map(h => ({ a: h.a, ha: h.ha, b: h.b, hb: h.hb }))
@@ -90,8 +96,8 @@ import { readFileSync } from 'node:fs';
 import { DanceSchema } from './src/types.ts';
 import { generateAllKeyframes } from './src/generate.ts';
 
-const PRECISION = ${PRECISION};
-function round(n) { return Math.round(n * 10 ** PRECISION) / 10 ** PRECISION; }
+const SCALE = 10 ** ${PRECISION};
+function round(n) { return Math.round(n * SCALE) / SCALE; }
 
 function serializeKeyframes(keyframes) {
   const plain = keyframes.map(kf => ({
@@ -1,10 +1,9 @@
 import { useRef, useEffect, useCallback, useState, useMemo } from 'react';
 import { Renderer, getFrameAtBeat } from './renderer';
-import { generateAllKeyframes, validateHandDistances, validateProgression, generateInstructionPreview, findInstructionStartBeat, findInstructionScope } from './generate';
-import { exportGif } from './exportGif';
+import { generateAllKeyframes, validateHandDistances, validateProgression, generateInstructionPreview, locateInstruction } from './generate';
 import CommandPane from './CommandPane';
-import type { Instruction, InitFormation, InstructionId, Keyframe, Dance } from './types';
-import { splitLists, instructionDuration, danceLength, InstructionSchema, DanceSchema, formatDanceParseError, ProtoDancerIdSchema, parseDancerId, BaseRelationshipSchema } from './types';
+import type { Instruction, InitFormation, InstructionId, Keyframe, Dance, ProtoDancerId } from './types';
+import { splitLists, instructionDuration, danceLength, DanceSchema, formatDanceParseError, ProtoDancerIdSchema, parseDancerId, BaseRelationshipSchema } from './types';
 import { resolveRelationship } from './generateUtils';
 import { decodeRelationship } from './fieldUtils';
 import { RelationshipHighlightContext } from './RelationshipHighlightContext';
@@ -28,44 +27,66 @@ function loadDanceFromLocalStorage(): { dance: Dance } | { error: string } | nul
   return { dance: result.data };
 }
 
-function findInstructionById(instrs: Instruction[], id: InstructionId): Instruction | null {
-  for (const i of instrs) {
-    if (i.id === id) return i;
-    if (i.type === 'split') {
-      const [listA, listB] = splitLists(i);
-      for (const s of [...listA, ...listB]) {
-        if (s.id === id) return InstructionSchema.parse(s);
-      }
-    }
-  }
-  return null;
+type HighlightTarget = { id: ProtoDancerId; targetProto: ProtoDancerId; offset: number };
+
+/** Each dancer's target under an encoded relationship, or null if it doesn't decode. */
+function resolveHighlightTargets(encoded: string): HighlightTarget[] | null {
+  const decoded = decodeRelationship(encoded);
+  const base = BaseRelationshipSchema.safeParse(decoded.base);
+  if (!base.success) return null;
+  const rel = { base: base.data, offset: decoded.offset };
+  return ProtoDancerIdSchema.options.map(id => {
+    const { proto: targetProto, offset } = parseDancerId(resolveRelationship(rel, id));
+    return { id, targetProto, offset };
+  });
 }
 
-function activeInstructionId(instructions: Instruction[], beat: number): InstructionId | null {
+type InstructionTiming = {
+  id: InstructionId;
+  start: number;
+  // For splits: each list's sub-instructions, with start beats relative to the split
+  lists: { id: InstructionId; start: number }[][] | null;
+};
+
+/** Start beats for every instruction, computed once per edit rather than on every animation frame. */
+function buildInstructionTimings(instructions: Instruction[]): InstructionTiming[] {
+  const timings: InstructionTiming[] = [];
   let currentBeat = 0;
-  let activeId: InstructionId | null = null;
   for (const instr of instructions) {
-    if (currentBeat > beat + 1e-9) break;
     if (instr.type === 'split') {
-      const rel = beat - currentBeat;
-      const [listA, listB] = splitLists(instr);
-      let b = 0;
-      for (const sub of listA) {
-        if (b > rel + 1e-9) break;
-        activeId = sub.id;
-        b += sub.beats;
-      }
-      b = 0;
-      for (const sub of listB) {
-        if (b > rel + 1e-9) break;
-        activeId = sub.id;
-        b += sub.beats;
-      }
+      const lists = splitLists(instr).map(list => {
+        let b = 0;
+        return list.map(sub => {
+          const timing = { id: sub.id, start: b };
+          b += sub.beats;
+          return timing;
+        });
+      });
+      timings.push({ id: instr.id, start: currentBeat, lists });
     } else {
-      activeId = instr.id;
+      timings.push({ id: instr.id, start: currentBeat, lists: null });
     }
     currentBeat += instructionDuration(instr);
   }
+  return timings;
+}
+
+function activeInstructionId(timings: InstructionTiming[], beat: number): InstructionId | null {
+  let activeId: InstructionId | null = null;
+  for (const timing of timings) {
+    if (timing.start > beat + 1e-9) break;
+    if (timing.lists) {
+      const rel = beat - timing.start;
+      for (const list of timing.lists) {
+        for (const sub of list) {
+          if (sub.start > rel + 1e-9) break;
+          activeId = sub.id;
+        }
+      }
+    } else {
+      activeId = timing.id;
+    }
+  }
   return activeId;
 }
 
@@ -99,6 +120,7 @@ export default function App() {
   const [smoothness, setSmoothness] = useState(100);
   const [drawerOpen, setDrawerOpen] = useState(false);
   const [exporting, setExporting] = useState(false);
+  const [exportError, setExportError] = useState<string | null>(null);
 
   // Persist dance to localStorage whenever it changes
   useEffect(() => {
@@ -112,6 +134,7 @@ export default function App() {
 
   const { keyframes, error: generateError } = useMemo(() => generateAllKeyframes(instructions, initFormation), [instructions, initFormation]);
   const DANCE_LENGTH = useMemo(() => danceLength(instructions), [instructions]);
+  const instructionTimings = useMemo(() => buildInstructionTimings(instructions), [instructions]);
   const warnings = useMemo(() => validateHandDistances(instructions, keyframes), [instructions, keyframes]);
   const progressionWarning = useMemo(() => validateProgression(keyframes, initFormation, progression), [keyframes, initFormation, progression]);
   const wrap = !progressionWarning;
@@ -119,10 +142,9 @@ export default function App() {
   // Compute preview keyframes when hovering over an instruction
   const previewKeyframes = useMemo(() => {
     if (!hoveredInstructionId) return [];
-    const instr = findInstructionById(instructions, hoveredInstructionId);
-    if (!instr) return [];
-    const startBeat = findInstructionStartBeat(instructions, hoveredInstructionId) ?? 0;
-    const scope = findInstructionScope(instructions, hoveredInstructionId);
+    const located = locateInstruction(instructions, hoveredInstructionId);
+    if (!located) return [];
+    const { instr, startBeat, scope } = located;
 
     // Find the keyframe at or before the start beat
     let prevKeyframe: Keyframe | null = null;
@@ -135,7 +157,8 @@ export default function App() {
   }, [hoveredInstructionId, instructions, keyframes]);
 
   // Relationship highlight: ref-based to avoid re-renders on fast mouse movements
-  const highlightedRelRef = useRef<string | null>(null);
+  // Holds the highlighted relationship's targets, resolved once when it changes rather than every frame
+  const highlightTargetsRef = useRef<HighlightTarget[] | null>(null);
   const highlightRelRafRef = useRef(0);
 
   const draw = useCallback(() => {
@@ -147,27 +170,20 @@ export default function App() {
       setAnnotation(frame.annotation || '');
 
       // Draw relationship highlight lines
-      const highlightedRel = highlightedRelRef.current;
-      if (highlightedRel) {
-        const decoded = decodeRelationship(highlightedRel);
-        const base = BaseRelationshipSchema.safeParse(decoded.base);
-        if (base.success) {
-          const rel = { base: base.data, offset: decoded.offset };
-          const lines: Array<{ fromX: number; fromY: number; toX: number; toY: number }> = [];
-          for (const id of ProtoDancerIdSchema.options) {
-            const targetId = resolveRelationship(rel, id);
-            const { proto: targetProto, offset } = parseDancerId(targetId);
-            const from = frame.dancers[id];
-            const to = frame.dancers[targetProto];
-            lines.push({
-              fromX: from.pos.x,
-              fromY: from.pos.y,
-              toX: to.pos.x,
-              toY: to.pos.y + offset * 2,
-            });
-          }
-          renderer.drawRelationshipLines(lines);
+      const highlightTargets = highlightTargetsRef.current;
+      if (highlightTargets) {
+        const lines: Array<{ fromX: number; fromY: number; toX: number; toY: number }> = [];
+        for (const { id, targetProto, offset } of highlightTargets) {
+          const from = frame.dancers[id];
+          const to = frame.dancers[targetProto];
+          lines.push({
+            fromX: from.pos.x,
+            fromY: from.pos.y,
+            toX: to.pos.x,
+            toY: to.pos.y + offset * 2,
+          });
         }
+        renderer.drawRelationshipLines(lines);
       }
     }
     // Draw preview keyframes overlay
@@ -183,7 +199,7 @@ export default function App() {
   });
 
   const setHighlightedRelationship = useCallback((encoded: string | null) => {
-    highlightedRelRef.current = encoded;
+    highlightTargetsRef.current = encoded ? resolveHighlightTargets(encoded) : null;
     cancelAnimationFrame(highlightRelRafRef.current);
     highlightRelRafRef.current = requestAnimationFrame(() => drawRef.current());
   }, []);
@@ -304,18 +320,18 @@ export default function App() {
   }, []);
 
   const handleEditInstruction = useCallback((id: InstructionId) => {
-    const startBeat = findInstructionStartBeat(instructions, id);
-    if (startBeat !== null) {
-      beatRef.current = startBeat;
+    const located = locateInstruction(instructions, id);
+    if (located) {
+      beatRef.current = located.startBeat;
       rendererRef.current?.clearTrails();
       drawRef.current();
     }
   }, [instructions]);
 
   const handleSkipToInstruction = useCallback((id: InstructionId) => {
-    const startBeat = findInstructionStartBeat(instructions, id);
-    if (startBeat !== null) {
-      beatRef.current = startBeat;
+    const located = locateInstruction(instructions, id);
+    if (located) {
+      beatRef.current = located.startBeat;
       rendererRef.current?.clearTrails();
       drawRef.current();
     }
@@ -324,8 +340,9 @@ export default function App() {
   const downloadGif = useCallback(() => {
     if (keyframes.length === 0) return;
     setExporting(true);
-    // Yield to let the UI show the "Exporting..." state before blocking
-    setTimeout(() => {
+    // Yield to let the UI show the "Exporting..." state before blocking.
+    // The GIF encoder is only needed here, so it is loaded on first export rather than with the app.
+    setTimeout(() => import('./exportGif').then(({ exportGif }) => {
       const w = 400;
       const h = 600;
       const offscreen = document.createElement('canvas');
@@ -349,8 +366,9 @@ export default function App() {
       a.download = 'dance.gif';
       a.click();
       URL.revokeObjectURL(url);
-      setExporting(false);
-    }, 50);
+    }).catch((e: unknown) => {
+      setExportError(e instanceof Error ? e.message : String(e));
+    }).finally(() => setExporting(false)), 50);
   }, [keyframes, bpm, smoothness, DANCE_LENGTH, progression, wrap]);
 
   const scrubberValue = DANCE_LENGTH > 0
@@ -417,7 +435,7 @@ export default function App() {
 
   const commandPaneProps = {
     instructions, setInstructions, initFormation, setInitFormation, progression, setProgression,
-    activeId: activeInstructionId(instructions, beat),
+    activeId: activeInstructionId(instructionTimings, beat),
     warnings, generateError, progressionWarning, keyframes, onHoverInstruction: handleHoverInstruction,
     onEditInstruction: handleEditInstruction,
     onSkipToInstruction: handleSkipToInstruction,
@@ -426,11 +444,22 @@ export default function App() {
   return (
     <RelationshipHighlightContext.Provider value={setHighlightedRelationship}>
     <div className="app-layout">
-      {localStorageError && (
-        <div className="localstorage-error">
-          <strong>Could not load saved dance from localStorage:</strong>
-          <pre>{localStorageError}</pre>
-          <button onClick={() => setLocalStorageError(null)}>Dismiss</button>
+      {(localStorageError || exportError) && (
+        <div className="error-banners">
+          {localStorageError && (
+            <div className="localstorage-error">
+              <strong>Could not load saved dance from localStorage:</strong>
+              <pre>{localStorageError}</pre>
+              <button onClick={() => setLocalStorageError(null)}>Dismiss</button>
+            </div>
+          )}
+          {exportError && (
+            <div className="export-error">
+              <strong>Could not export GIF:</strong>
+              <pre>{exportError}</pre>
+              <button onClick={() => setExportError(null)}>Dismiss</button>
+            </div>
+          )}
         </div>
       )}
       <div className="vis-column">
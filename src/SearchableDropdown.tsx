@@ -36,8 +36,10 @@ const SearchableDropdown = forwardRef<SearchableDropdownHandle, Props>(function
 
   // In select mode, filtering uses internal searchText; in text mode, uses value
   const query = (selectOnly ? searchText : value).toLowerCase();
-  const filtered = query
-    ? options.filter(opt => new RegExp('\\b' + query.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).test(labelOf(opt).toLowerCase()))
+  // Compile the word-start pattern once, not once per option
+  const queryRe = query ? new RegExp('\\b' + query.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')) : null;
+  const filtered = queryRe
+    ? options.filter(opt => queryRe.test(labelOf(opt).toLowerCase()))
     : options;
 
   // What to display in the input
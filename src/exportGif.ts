@@ -24,19 +24,20 @@ export interface GifExportOptions {
 
 const DEFAULT_BG_COLOR = '#0f0f23';
 
+type RgbaFrame = { data: Uint8ClampedArray; width: number; height: number };
+
 /**
- * Encode an array of raw RGBA frames into a looping GIF.
+ * Encode a sequence of raw RGBA frames into a looping GIF.
+ * Frames are consumed one at a time, so a generator never has to hold them all.
  */
 export function encodeGifFromFrames(
-  frames: { data: Uint8ClampedArray; width: number; height: number }[],
+  frames: Iterable<RgbaFrame>,
   delay: number,
 ): Uint8Array {
-  if (frames.length === 0) throw new Error('No frames to encode');
-
   const gif = GIFEncoder();
 
-  for (let i = 0; i < frames.length; i++) {
-    const { data, width, height } = frames[i];
+  let i = 0;
+  for (const { data, width, height } of frames) {
     const palette = quantize(data, 256);
     const index = applyPalette(data, palette);
     gif.writeFrame(index, width, height, {
@@ -44,7 +45,9 @@ export function encodeGifFromFrames(
       delay,
       ...(i === 0 ? { repeat: 0 } : {}),
     });
+    i++;
   }
+  if (i === 0) throw new Error('No frames to encode');
 
   gif.finish();
   return gif.bytes();
@@ -85,24 +88,26 @@ export function exportGif(
 
   const renderer = new Renderer(ctx, width, height);
 
-  const frames: { data: Uint8ClampedArray; width: number; height: number }[] = [];
-
-  for (let beat = minBeat; beat <= maxBeat + beatStep / 2; beat += beatStep) {
-    const clampedBeat = Math.min(beat, maxBeat);
-    const frame = getFrameAtBeat(keyframes, clampedBeat, smoothness, danceLength, progression, wrap);
-    if (!frame) continue;
-
-    renderer.drawFrame(frame, progressionRate);
-
-    // drawFrame clears to transparent then draws content on top.
-    // Fill background behind the rendered content.
-    ctx.globalCompositeOperation = 'destination-over';
-    ctx.fillStyle = bgColor;
-    ctx.fillRect(0, 0, width, height);
-    ctx.globalCompositeOperation = 'source-over';
-
-    frames.push({ data: ctx.getImageData(0, 0, width, height).data, width, height });
+  // Render lazily: each frame's pixels are quantized and dropped before the
+  // next one is drawn, instead of holding every RGBA buffer at once.
+  function* renderFrames(): Generator<RgbaFrame> {
+    for (let beat = minBeat; beat <= maxBeat + beatStep / 2; beat += beatStep) {
+      const clampedBeat = Math.min(beat, maxBeat);
+      const frame = getFrameAtBeat(keyframes, clampedBeat, smoothness, danceLength, progression, wrap);
+      if (!frame) continue;
+
+      renderer.drawFrame(frame, progressionRate);
+
+      // drawFrame clears to transparent then draws content on top.
+      // Fill background behind the rendered content.
+      ctx.globalCompositeOperation = 'destination-over';
+      ctx.fillStyle = bgColor;
+      ctx.fillRect(0, 0, width, height);
+      ctx.globalCompositeOperation = 'source-over';
+
+      yield { data: ctx.getImageData(0, 0, width, height).data, width, height };
+    }
   }
 
-  return encodeGifFromFrames(frames, delayMs);
+  return encodeGifFromFrames(renderFrames(), delayMs);
 }
@@ -72,9 +72,21 @@ export function makeInstructionId(): InstructionId {
   return InstructionIdSchema.parse(crypto.randomUUID());
 }
 
+// Every text parseDirection has already accepted, mapped to its (never-mutated) result,
+// so repeat lookups skip the schema checks.
+const parsedDirections = new Map<string, RelativeDirection>();
+
 export function parseDirection(text: string): RelativeDirection | null {
   const trimmed = text.trim().toLowerCase();
   if (!trimmed) return null;
+  const cached = parsedDirections.get(trimmed);
+  if (cached) return cached;
+  const parsed = parseDirectionUncached(trimmed);
+  if (parsed) parsedDirections.set(trimmed, parsed);
+  return parsed;
+}
+
+function parseDirectionUncached(trimmed: string): RelativeDirection | null {
   const asDir = RelativeDirectionSchema.safeParse({ kind: 'direction', value: trimmed });
   if (asDir.success) return asDir.data;
   // Try parsing as a base relationship name with offset 0
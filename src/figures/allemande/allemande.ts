@@ -1,8 +1,8 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, HandConnection, ProtoDancerId } from '../../types';
 import { Vector, dancerPosition, makeFinalKeyframe } from '../../types';
-import { averagePos, copyDancers, resolvePairs } from '../../generateUtils';
+import { resolvePairs, rotateByCosSin } from '../../generateUtils';
 
-type OrbitDatum = { protoId: ProtoDancerId; center: Vector; initOffsetFromCenter: Vector };
+type OrbitDatum = { protoId: ProtoDancerId; center: Vector; initOffsetFromCenter: Vector; initFacing: Vector };
 
 function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'allemande' }>, scope: Set<ProtoDancerId>) {
   const totalAngleRad = instr.rotations * 2 * Math.PI * (instr.handedness === 'right' ? -1 : 1);
@@ -22,9 +22,10 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'allema
     const da = prev.dancers[id];
     const partnerPos = dancerPosition(target, prev.dancers).pos;
     const center = da.pos.add(partnerPos).multiply(0.5);
+    const initOffsetFromCenter = da.pos.subtract(center);
     orbitData.push({
-      protoId: id, center,
-      initOffsetFromCenter: da.pos.subtract(center),
+      protoId: id, center, initOffsetFromCenter,
+      initFacing: initOffsetFromCenter.normalize().rotateByDegrees(instr.handedness === 'right' ? -90 : 90),
     });
   }
 
@@ -33,14 +34,16 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'allema
 
 export function finalAllemande(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'allemande' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const pairs = resolvePairs(instr.relationship, prev.dancers, scope, {});
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   const hands: HandConnection[] = [];
   for (const [proto, other] of pairs) {
-    const center = averagePos([proto, other].map(d => dancerPosition(d, prev.dancers).pos));
+    const center = prev.dancers[proto].pos.add(dancerPosition(other, prev.dancers).pos).multiply(0.5);
     const initOffsetFromCenter = prev.dancers[proto].pos.subtract(center);
     const finalOffsetFromCenter = initOffsetFromCenter.normalize().multiply(0.25).rotateByDegrees(360 * instr.rotations * (instr.handedness === 'right' ? -1 : 1));
-    dancers[proto].pos = center.add(finalOffsetFromCenter);
-    dancers[proto].facing = finalOffsetFromCenter.subtract(center).normalize().rotateByDegrees(90 * (instr.handedness === 'right' ? -1 : 1));
+    dancers[proto] = {
+      pos: center.add(finalOffsetFromCenter),
+      facing: finalOffsetFromCenter.subtract(center).normalize().rotateByDegrees(90 * (instr.handedness === 'right' ? -1 : 1)),
+    };
     hands.push({ a: proto, ha: instr.handedness, b: other, hb: instr.handedness });
   }
 
@@ -61,11 +64,16 @@ export function generateAllemande(prev: Keyframe, _final: FinalKeyframe, instr:
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
     const angleOffset = t * totalAngleRad;
+    const cos = Math.cos(angleOffset);
+    const sin = Math.sin(angleOffset);
 
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
     for (const od of orbitData) {
-      dancers[od.protoId].pos = od.center.add(od.initOffsetFromCenter.rotateByRadians(angleOffset));
-      dancers[od.protoId].facing = dancers[od.protoId].pos.subtract(od.center).normalize().rotateByDegrees(instr.handedness === 'right' ? -90 : 90)
+      // The facing keeps its quarter-turn from the offset, so it turns by the same angle
+      dancers[od.protoId] = {
+        pos: od.center.add(rotateByCosSin(od.initOffsetFromCenter, cos, sin)),
+        facing: rotateByCosSin(od.initFacing, cos, sin),
+      };
     }
 
     result.push({ beat, dancers, hands });
@@ -1,13 +1,14 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { dancerPosition, makeFinalKeyframe } from '../../types';
-import { copyDancers, resolveRelationship } from '../../generateUtils';
+import { resolveRelationship } from '../../generateUtils';
 
 // eslint-disable-next-line @typescript-eslint/no-unused-vars
 export function finalBalance(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'balance' }>, _scope: Set<ProtoDancerId>): FinalKeyframe {
-  // A balance always returns to the starting position.
+  // A balance always returns to the starting position, so the (never-mutated)
+  // dancer states can be shared outright.
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands: prev.hands,
   });
 }
@@ -15,13 +16,15 @@ export function finalBalance(prev: Keyframe, instr: Extract<AtomicInstruction, {
 export function generateBalance(prev: Keyframe, _final: FinalKeyframe, instr: Extract<AtomicInstruction, { type: 'balance' }>, scope: Set<ProtoDancerId>): Keyframe[] {
   const halfBeats = instr.beats / 2;
 
-  const steppedDancers = copyDancers(prev.dancers);
+  const steppedDancers = { ...prev.dancers };
   for (const id of scope) {
     const d = prev.dancers[id];
     const target = resolveRelationship(instr.relationship, id);
     const dispToTarget = dancerPosition(target, prev.dancers).pos.subtract(d.pos);
-    const stepVec = dispToTarget.normalize().multiply(Math.min(dispToTarget.length() * 0.3, dispToTarget.length()/2 - 0.1));
-    steppedDancers[id].pos = d.pos.add(stepVec);
+    // Step 30% of the way, but stop at least 0.1m short of the midpoint.
+    // Scaling the displacement directly needs only one length() per dancer.
+    const dist = dispToTarget.length();
+    steppedDancers[id] = { pos: d.pos.add(dispToTarget.multiply(Math.min(0.3, 0.5 - 0.1 / dist))), facing: d.facing };
   }
 
   return [
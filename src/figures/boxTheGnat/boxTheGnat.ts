@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, DancerId } from '../../types';
 import { makeFinalKeyframe, dancerPosition } from '../../types';
-import { copyDancers, ellipsePosition, isLark, resolvePairs } from '../../generateUtils';
+import { ellipsePath, isLark, resolvePairs } from '../../generateUtils';
 import { Vector } from 'vecti';
 
 type GnatPair = {
@@ -8,7 +8,7 @@ type GnatPair = {
   foil: DancerId;
   protoStart: Vector;
   foilStart: Vector;
-  semiMinor: number;
+  path: (phi: number) => Vector;
 };
 
 function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'box_the_gnat' }>, scope: Set<ProtoDancerId>) {
@@ -25,7 +25,7 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'box_th
       proto, foil,
       protoStart: protoState.pos,
       foilStart: foilState.pos,
-      semiMinor: dist / 4,
+      path: ellipsePath(protoState.pos, foilState.pos, dist / 4),
     });
   }
 
@@ -41,10 +41,9 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'box_th
 export function finalBoxTheGnat(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'box_the_gnat' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { pairs } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const p of pairs) {
-    dancers[p.proto].pos = p.foilStart;
-    dancers[p.proto].facing = p.protoStart.subtract(p.foilStart).normalize();
+    dancers[p.proto] = { pos: p.foilStart, facing: p.protoStart.subtract(p.foilStart).normalize() };
   }
 
   // Hands are dropped at the end (revert to prev.hands)
@@ -65,10 +64,12 @@ export function generateBoxTheGnat(prev: Keyframe, _final: FinalKeyframe, instr:
     const beat = prev.beat + t * instr.beats;
     const theta = Math.PI * t;
 
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
     for (const p of pairs) {
-      dancers[p.proto].pos = ellipsePosition(p.protoStart, p.foilStart, p.semiMinor, theta);
-      dancers[p.proto].facing = p.foilStart.subtract(p.protoStart).normalize().rotateByRadians(Math.PI * t * (isLark(p.proto) ? -1 : 1));
+      dancers[p.proto] = {
+        pos: p.path(theta),
+        facing: p.foilStart.subtract(p.protoStart).normalize().rotateByRadians(Math.PI * t * (isLark(p.proto) ? -1 : 1)),
+      };
     }
 
     result.push({ beat, dancers, hands: gnatHands });
@@ -1,7 +1,7 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, HandConnection, DancerId } from '../../types';
 import { parseDancerId, makeFinalKeyframe, dancerPosition } from '../../types';
 import { Vector } from 'vecti';
-import { copyDancers, ellipsePosition, isLark, findDancerOnSide } from '../../generateUtils';
+import { ellipsePath, isLark, findDancerOnSide } from '../../generateUtils';
 
 
 type TwirlPair = {
@@ -9,7 +9,7 @@ type TwirlPair = {
   foil: DancerId;
   protoStart: Vector;
   foilStart: Vector;
-  semiMinor: number;
+  path: (phi: number) => Vector;
   protoStartFacing: Vector;
   foilStartFacing: Vector;
 };
@@ -33,7 +33,8 @@ function setup(prev: Keyframe, _instr: Extract<AtomicInstruction, { type: 'calif
       foil: foil.dancerId,
       protoStart: protoState.pos,
       foilStart: foilState.pos,
-      semiMinor: dist / 4,
+      // CW ellipse: positive semiMinor
+      path: ellipsePath(protoState.pos, foilState.pos, dist / 4),
       protoStartFacing: protoState.facing,
       foilStartFacing: foilState.facing,
     });
@@ -51,11 +52,12 @@ function setup(prev: Keyframe, _instr: Extract<AtomicInstruction, { type: 'calif
 export function finalCaliforniaTwirl(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'california_twirl' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { pairs, insideHands } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const p of pairs) {
-    // CW ellipse: positive semiMinor
-    dancers[p.proto].pos = ellipsePosition(p.protoStart, p.foilStart, p.semiMinor, Math.PI);
-    dancers[p.proto].facing = p.protoStartFacing.multiply(-1);
+    dancers[p.proto] = {
+      pos: p.path(Math.PI),
+      facing: p.protoStartFacing.multiply(-1),
+    };
   }
 
   // End holding inside hands only (no other hands)
@@ -76,10 +78,12 @@ export function generateCaliforniaTwirl(prev: Keyframe, _final: FinalKeyframe, i
     const beat = prev.beat + t * instr.beats;
     const theta = Math.PI * t;
 
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
     for (const p of pairs) {
-      dancers[p.proto].pos = ellipsePosition(p.protoStart, p.foilStart, p.semiMinor, theta);
-      dancers[p.proto].facing = p.protoStartFacing.rotateByRadians(Math.PI * t * (isLark(p.proto) ? -1 : 1));
+      dancers[p.proto] = {
+        pos: p.path(theta),
+        facing: p.protoStartFacing.rotateByRadians(Math.PI * t * (isLark(p.proto) ? -1 : 1)),
+      };
     }
 
     // Inside hands + drop everything else
@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, HandConnection, ProtoDancerId } from '../../types';
 import { Vector, makeFinalKeyframe } from '../../types';
-import { PROTO_DANCER_IDS, averagePos, copyDancers, findDancerOnSide } from '../../generateUtils';
+import { PROTO_DANCER_IDS, averagePos, findDancerOnSide, rotateByCosSin } from '../../generateUtils';
 
   type OrbitDatum = { protoId: ProtoDancerId; initOffsetFromCenter: Vector; radius: number };
 
@@ -14,12 +14,11 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'circle
   const orbitData: OrbitDatum[] = [];
   for (const id of PROTO_DANCER_IDS) {
     if (!scope.has(id)) continue;
-    const d = prev.dancers[id];
-    const delta = d.pos.subtract(center);
+    const initOffsetFromCenter = prev.dancers[id].pos.subtract(center);
     orbitData.push({
       protoId: id,
-      initOffsetFromCenter: d.pos.subtract(center),
-      radius: delta.length(),
+      initOffsetFromCenter,
+      radius: initOffsetFromCenter.length(),
     });
   }
 
@@ -39,10 +38,10 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'circle
 export function finalCircle(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'circle' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { totalAngleRad, center, orbitData, hands } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const od of orbitData) {
-    dancers[od.protoId].pos = center.add(od.initOffsetFromCenter.rotateByRadians(totalAngleRad));
-    dancers[od.protoId].facing = center.subtract(dancers[od.protoId].pos).normalize();
+    const pos = center.add(od.initOffsetFromCenter.rotateByRadians(totalAngleRad));
+    dancers[od.protoId] = { pos, facing: center.subtract(pos).normalize() };
   }
 
   return makeFinalKeyframe({ beat: prev.beat + instr.beats, dancers, hands });
@@ -57,11 +56,13 @@ export function generateCircle(prev: Keyframe, _final: FinalKeyframe, instr: Ext
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
     const angleOffset = t * totalAngleRad;
-    const dancers = copyDancers(prev.dancers);
+    const cos = Math.cos(angleOffset);
+    const sin = Math.sin(angleOffset);
+    const dancers = { ...prev.dancers };
     for (const od of orbitData) {
-      dancers[od.protoId].pos = center.add(od.initOffsetFromCenter.rotateByRadians(angleOffset));
-      // Face center
-      dancers[od.protoId].facing = center.subtract(dancers[od.protoId].pos).normalize();
+      const offset = rotateByCosSin(od.initOffsetFromCenter, cos, sin);
+      // Face center; the radius is fixed, so no need to renormalize
+      dancers[od.protoId] = { pos: center.add(offset), facing: offset.multiply(-1 / od.radius) };
     }
     result.push({ beat, dancers, hands });
   }
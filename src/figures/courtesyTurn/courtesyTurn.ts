@@ -1,13 +1,13 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, HandConnection, DancerId } from '../../types';
 import { Vector, makeFinalKeyframe, dancerPosition } from '../../types';
-import { copyDancers, isLark, findDancerOnSide, PROTO_DANCER_IDS } from '../../generateUtils';
+import { isLark, findDancerOnSide, PROTO_DANCER_IDS } from '../../generateUtils';
 
 export function finalCourtesyTurn(
   prev: Keyframe,
   instr: Extract<AtomicInstruction, { type: 'courtesy_turn' }>,
   scope: Set<ProtoDancerId>,
 ): FinalKeyframe {
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   const hands: HandConnection[] = [];
 
   for (const id of PROTO_DANCER_IDS) {
@@ -19,8 +19,7 @@ export function finalCourtesyTurn(
     const foilPos = dancerPosition(foil.dancerId, prev.dancers).pos;
     if ((ourPos.x < 0) !== (foilPos.x < 0)) throw new Error(`courtesy_turn: ${id} and foil ${foil.dancerId} are on opposite sides of the set`);
 
-    dancers[id].pos = foilPos;
-    dancers[id].facing = dancers[id].facing.multiply(-1);
+    dancers[id] = { pos: foilPos, facing: prev.dancers[id].facing.multiply(-1) };
 
     hands.push({ a: id, ha: 'left', b: foil.dancerId, hb: 'left' });
   }
@@ -67,6 +66,13 @@ export function generateCourtesyTurn(
     });
   }
 
+  // Both hands are held throughout, so every frame shares one list of connections
+  const hands: HandConnection[] = [];
+  for (const { proto, foil } of pairs) {
+    hands.push({ a: proto, ha: 'left', b: foil, hb: 'left' });
+    hands.push({ a: proto, ha: 'right', b: foil, hb: 'right' });
+  }
+
   // Generate intermediate keyframes (not including the final)
   const nFrames = Math.max(1, Math.round(totalBeats / 0.25));
   const result: Keyframe[] = [];
@@ -75,21 +81,19 @@ export function generateCourtesyTurn(
     const t = i / nFrames;
     const beat = prev.beat + t * totalBeats;
     const elapsed = t * totalBeats;
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
 
     const tPhase = elapsed / totalBeats;
-    const hands: HandConnection[] = [];
 
-    for (const { proto, foil, center, radius } of pairs) {
+    for (const { proto, center, radius } of pairs) {
       const facing = prev.dancers[proto].facing.rotateByRadians(tPhase * Math.PI);
 
-      dancers[proto].facing = facing;
-      dancers[proto].pos = center.add(facing
+      dancers[proto] = {
+        facing,
+        pos: center.add(facing
           .multiply(radius)
-          .rotateByRadians(Math.PI/2 * (isLark(proto) ? 1 : -1)));
-
-      hands.push({ a: proto, ha: 'left', b: foil, hb: 'left' });
-      hands.push({ a: proto, ha: 'right', b: foil, hb: 'right' });
+          .rotateByRadians(Math.PI/2 * (isLark(proto) ? 1 : -1))),
+      };
     }
 
     result.push({ beat, dancers, hands });
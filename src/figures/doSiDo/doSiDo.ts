@@ -1,12 +1,10 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { type Vector, dancerPosition, makeFinalKeyframe } from '../../types';
-import { copyDancers, ellipsePosition, resolvePairs } from '../../generateUtils';
+import { ellipsePath, resolvePairs } from '../../generateUtils';
 
 type OrbitDatum = {
   protoId: ProtoDancerId;
-  startPos: Vector;
-  partnerPos: Vector;
-  semiMinor: number;
+  path: (phi: number) => Vector;
   originalFacing: Vector;
 };
 
@@ -21,9 +19,7 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'do_si_
     const dist = da.pos.subtract(partnerState.pos).length();
     orbitData.push({
       protoId: id,
-      startPos: da.pos,
-      partnerPos: partnerState.pos,
-      semiMinor: dist / 4,
+      path: ellipsePath(da.pos, partnerState.pos, dist / 4),
       originalFacing: da.facing,
     });
   }
@@ -34,10 +30,9 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'do_si_
 export function finalDoSiDo(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'do_si_do' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { totalAngleRad, orbitData } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const od of orbitData) {
-    dancers[od.protoId].pos = ellipsePosition(od.startPos, od.partnerPos, od.semiMinor, totalAngleRad);
-    dancers[od.protoId].facing = od.originalFacing;
+    dancers[od.protoId] = { pos: od.path(totalAngleRad), facing: od.originalFacing };
   }
 
   return makeFinalKeyframe({
@@ -56,10 +51,9 @@ export function generateDoSiDo(prev: Keyframe, _final: FinalKeyframe, instr: Ext
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
     const phase = t * totalAngleRad;
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
     for (const od of orbitData) {
-      dancers[od.protoId].pos = ellipsePosition(od.startPos, od.partnerPos, od.semiMinor, phase);
-      dancers[od.protoId].facing = od.originalFacing;
+      dancers[od.protoId] = { pos: od.path(phase), facing: od.originalFacing };
     }
     result.push({ beat, dancers, hands: prev.hands });
   }
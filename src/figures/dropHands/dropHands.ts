@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { parseDancerId, makeFinalKeyframe } from '../../types';
-import { PROTO_DANCER_IDS, copyDancers, resolveRelationship } from '../../generateUtils';
+import { PROTO_DANCER_IDS, resolveRelationship } from '../../generateUtils';
 
 export function finalDropHands(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'drop_hands' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const target = instr.target;
@@ -27,7 +27,7 @@ export function finalDropHands(prev: Keyframe, instr: Extract<AtomicInstruction,
 
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands: newHands,
   });
 }
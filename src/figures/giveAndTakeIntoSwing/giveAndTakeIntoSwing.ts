@@ -186,11 +186,13 @@ export function generateGiveAndTakeIntoSwing(prev: Keyframe, _final: FinalKeyfra
 
   // Apply drift to swing intermediates
   // Total swing frames = intermediates + 1 (for the swing final that becomes the G&T final)
+  // Append them straight after the walk frames rather than concatenating copies.
   const nTotalSwingFrames = rawSwingIntermediates.length + 1;
-  const shiftedSwingIntermediates = rawSwingIntermediates.map((kf, idx) => {
+  const result = walkFrames;
+  for (let idx = 0; idx < rawSwingIntermediates.length; idx++) {
     const t = (idx + 1) / nTotalSwingFrames;
-    return applyDrift(kf, driftData, t);
-  });
+    result.push(applyDrift(rawSwingIntermediates[idx], driftData, t));
+  }
 
-  return [...walkFrames, ...shiftedSwingIntermediates];
+  return result;
 }
@@ -79,7 +79,7 @@ export function finalLongLines(prev: Keyframe, instr: Extract<AtomicInstruction,
 
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands,
   });
 }
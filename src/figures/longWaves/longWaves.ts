@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, HandConnection } from '../../types';
 import { parseDancerId, dancerPosition, makeFinalKeyframe } from '../../types';
-import { PROTO_DANCER_IDS, copyDancers, isLark, resolveInsideHand, findDancerOnSide, angleBetweenFacings } from '../../generateUtils';
+import { PROTO_DANCER_IDS, isLark, resolveInsideHand, findDancerOnSide, angleBetweenFacings } from '../../generateUtils';
 
 /**
  * Long waves: 0-beat assertion figure.
@@ -66,7 +66,7 @@ export function finalLongWaves(prev: Keyframe, instr: Extract<AtomicInstruction,
 
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands: newHands,
   });
 }
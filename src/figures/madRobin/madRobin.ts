@@ -1,11 +1,10 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { type Vector, parseDancerId, dancerPosition, EAST, WEST, makeFinalKeyframe } from '../../types';
-import { copyDancers, ellipsePosition, resolvePairs } from '../../generateUtils';
+import { ellipsePath, resolvePairs } from '../../generateUtils';
 
 type OrbitDatum = {
   protoId: ProtoDancerId;
-  startPos: Vector;
-  partnerPos: Vector;
+  path: (phi: number) => Vector;
   acrossFacing: Vector;
 };
 
@@ -59,8 +58,7 @@ function setup(
 
     orbitData.push({
       protoId: id,
-      startPos: da.pos,
-      partnerPos: targetPos,
+      path: ellipsePath(da.pos, targetPos, 0.25),
       acrossFacing: da.pos.x < 0 ? EAST : WEST,
     });
   }
@@ -75,10 +73,9 @@ export function finalMadRobin(
 ): FinalKeyframe {
   const { totalAngleRad, orbitData } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const od of orbitData) {
-    dancers[od.protoId].pos = ellipsePosition(od.startPos, od.partnerPos, 0.25, totalAngleRad);
-    dancers[od.protoId].facing = od.acrossFacing;
+    dancers[od.protoId] = { pos: od.path(totalAngleRad), facing: od.acrossFacing };
   }
 
   return makeFinalKeyframe({
@@ -102,10 +99,9 @@ export function generateMadRobin(
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
     const phi = t * totalAngleRad;
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
     for (const od of orbitData) {
-      dancers[od.protoId].pos = ellipsePosition(od.startPos, od.partnerPos, 0.25, phi);
-      dancers[od.protoId].facing = od.acrossFacing;
+      dancers[od.protoId] = { pos: od.path(phi), facing: od.acrossFacing };
     }
     result.push({ beat, dancers, hands: prev.hands });
   }
@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, HandConnection, DancerId } from '../../types';
 import { makeDancerId, parseDancerId, dancerPosition, makeFinalKeyframe } from '../../types';
-import { PROTO_DANCER_IDS, copyDancers, isLark, resolveInsideHand, findDancerOnSide, angleBetweenFacings } from '../../generateUtils';
+import { PROTO_DANCER_IDS, isLark, resolveInsideHand, findDancerOnSide, angleBetweenFacings } from '../../generateUtils';
 
 /**
  * Short waves: 0-beat assertion figure.
@@ -81,7 +81,7 @@ export function finalShortWaves(prev: Keyframe, instr: Extract<AtomicInstruction
 
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands: newHands,
   });
 }
@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { Vector, parseDancerId, headingAngle, makeFinalKeyframe, NORTH, SOUTH, EAST, WEST } from '../../types';
-import { copyDancers, ellipsePosition, resolvePairs, isLark } from '../../generateUtils';
+import { ellipsePath, resolvePairs, isLark, rotateByCosSin } from '../../generateUtils';
 
 type ShoulderPair = {
   lark: ProtoDancerId;
@@ -51,7 +51,7 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'should
 export function finalShoulderRound(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'shoulder_round' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { pairs } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   const separation = 0.5;
 
   for (const { lark, robin, center } of pairs) {
@@ -63,10 +63,8 @@ export function finalShoulderRound(prev: Keyframe, instr: Extract<AtomicInstruct
 
     // Lark and robin end 0.5m apart, same center of mass
     // They need to be on each other's [right/left] based on handedness
-    dancers[lark].pos = center.add(larkEndFacing.multiply(separation / 2).rotateByDegrees(90 * (instr.handedness === 'right' ? 1 : -1)));
-    dancers[robin].pos = center.add(robinEndFacing.multiply(separation / 2).rotateByDegrees(90 * (instr.handedness === 'right' ? 1 : -1)));
-    dancers[lark].facing = larkEndFacing;
-    dancers[robin].facing = robinEndFacing;
+    dancers[lark] = { pos: center.add(larkEndFacing.multiply(separation / 2).rotateByDegrees(90 * (instr.handedness === 'right' ? 1 : -1))), facing: larkEndFacing };
+    dancers[robin] = { pos: center.add(robinEndFacing.multiply(separation / 2).rotateByDegrees(90 * (instr.handedness === 'right' ? 1 : -1))), facing: robinEndFacing };
   }
 
   // No hand connections at end
@@ -94,6 +92,43 @@ export function generateShoulderRound(prev: Keyframe, final: FinalKeyframe, inst
   const approachBeats = totalBeats * approachFraction;
   const revolveBeats = totalBeats - approachBeats;
 
+  // Omega ~ pi/2 per beat (1 rotation per 4 beats)
+  const omega = Math.PI / 2;
+  const baseAngle = omega * revolveBeats;
+  // CW for right shoulder, CCW for left shoulder
+  const revolveSign = instr.handedness === 'right' ? -1 : 1;
+
+  // The approach paths and phase-2 orbit depend only on the pair, so work them out once rather than every frame
+  const orbits = pairs.map(({ lark, robin, dist }) => {
+    const larkState = prev.dancers[lark];
+    const robinState = prev.dancers[robin];
+
+    // Ellipse with lateralSign determines CW vs CCW path
+    const larkPath = ellipsePath(larkState.pos, robinState.pos, lateralSign * dist / 4);
+    const robinPath = ellipsePath(robinState.pos, larkState.pos, lateralSign * dist / 4);
+
+    // Compute where they are after the approach (1/4 ellipse)
+    const approachLark = larkPath(Math.PI / 2);
+    const approachRobin = robinPath(Math.PI / 2);
+    const revolveCenter = approachLark.add(approachRobin).multiply(0.5);
+
+    // Initial angle of lark from revolve center
+    const larkRevolveDelta = approachLark.subtract(revolveCenter);
+
+    // Compute target angle from final keyframe
+    const finalLarkDelta = final.dancers[lark].pos.subtract(revolveCenter);
+
+    // Total revolve angle
+    const neededRads = revolveSign * (headingAngle(finalLarkDelta) - headingAngle(larkRevolveDelta));
+    const nRots = Math.round((revolveSign * baseAngle - neededRads) / (2 * Math.PI));
+    const totalAngle = neededRads + nRots * 2 * Math.PI;
+
+    // The lark faces along the orbit: a quarter turn from the direction out of the center
+    const larkTangent = larkRevolveDelta.normalize().rotateByRadians(revolveSign * Math.PI / 2);
+
+    return { larkPath, robinPath, revolveCenter, larkRevolveDelta, larkTangent, totalAngle };
+  });
+
   const result: Keyframe[] = [];
 
   for (let i = 1; i < nFrames; i++) {
@@ -101,9 +136,10 @@ export function generateShoulderRound(prev: Keyframe, final: FinalKeyframe, inst
     const beat = prev.beat + t * totalBeats;
     const elapsed = t * totalBeats;
 
-    const dancers = copyDancers(prev.dancers);
+    const dancers = { ...prev.dancers };
 
-    for (const { lark, robin, dist } of pairs) {
+    for (let p = 0; p < pairs.length; p++) {
+      const { lark, robin } = pairs[p];
       const larkState = prev.dancers[lark];
       const robinState = prev.dancers[robin];
 
@@ -114,47 +150,26 @@ export function generateShoulderRound(prev: Keyframe, final: FinalKeyframe, inst
         const theta = (Math.PI / 2) * tPhase;
 
         // Face each other
-        dancers[lark].facing = robinState.pos.subtract(larkState.pos).normalize();
-        dancers[robin].facing = larkState.pos.subtract(robinState.pos).normalize();
-
-        // Ellipse with lateralSign determines CW vs CCW path
-        dancers[lark].pos = ellipsePosition(larkState.pos, robinState.pos, lateralSign * dist / 4, theta);
-        dancers[robin].pos = ellipsePosition(robinState.pos, larkState.pos, lateralSign * dist / 4, theta);
+        dancers[lark] = { pos: orbits[p].larkPath(theta), facing: robinState.pos.subtract(larkState.pos).normalize() };
+        dancers[robin] = { pos: orbits[p].robinPath(theta), facing: larkState.pos.subtract(robinState.pos).normalize() };
       } else {
         // Phase 2: revolve around center of mass
-        // Compute where they are after the approach (1/4 ellipse)
-        const approachLark = ellipsePosition(larkState.pos, robinState.pos, lateralSign * dist / 4, Math.PI / 2);
-        const approachRobin = ellipsePosition(robinState.pos, larkState.pos, lateralSign * dist / 4, Math.PI / 2);
-        const revolveCenter = approachLark.add(approachRobin).multiply(0.5);
-
-        // Initial angle of lark from revolve center
-        const larkRevolveDelta = approachLark.subtract(revolveCenter);
-
+        const { revolveCenter, larkRevolveDelta, larkTangent, totalAngle } = orbits[p];
         const tPhase = (elapsed - approachBeats) / revolveBeats;
 
-        // Compute target angle from final keyframe
-        const finalLarkDelta = final.dancers[lark].pos.subtract(revolveCenter);
-
-        // Total revolve angle
-        // Omega ~ pi/2 per beat (1 rotation per 4 beats)
-        const omega = Math.PI / 2;
-        const baseAngle = omega * revolveBeats;
-        // CW for right shoulder, CCW for left shoulder
-        const revolveSign = instr.handedness === 'right' ? -1 : 1;
-        const neededRads = revolveSign * (headingAngle(finalLarkDelta) - headingAngle(larkRevolveDelta));
-        const nRots = Math.round((revolveSign * baseAngle - neededRads) / (2 * Math.PI));
-        const totalAngle = neededRads + nRots * 2 * Math.PI;
-        console.log({tPhase, totalAngle})
-
-        const currentLarkFacing = larkRevolveDelta.normalize().rotateByRadians(revolveSign * Math.PI / 2 + totalAngle*tPhase);
-        const currentRobinFacing = currentLarkFacing.multiply(-1);
-
-        dancers[lark].pos = revolveCenter.add(larkRevolveDelta.rotateByRadians(totalAngle*tPhase));
-        dancers[robin].pos = revolveCenter.add(larkRevolveDelta.rotateByRadians(totalAngle*tPhase + Math.PI));
+        // Both positions and the facing turn by the same angle, so share one cos/sin
+        const angle = totalAngle * tPhase;
+        const cos = Math.cos(angle);
+        const sin = Math.sin(angle);
+        const larkOffset = rotateByCosSin(larkRevolveDelta, cos, sin);
 
         // Face tangent to the orbit
-        dancers[lark].facing = currentLarkFacing;
-        dancers[robin].facing = currentRobinFacing;
+        const currentLarkFacing = rotateByCosSin(larkTangent, cos, sin);
+        const currentRobinFacing = currentLarkFacing.multiply(-1);
+
+        // The robin is diametrically opposite the lark
+        dancers[lark] = { pos: revolveCenter.add(larkOffset), facing: currentLarkFacing };
+        dancers[robin] = { pos: revolveCenter.subtract(larkOffset), facing: currentRobinFacing };
       }
     }
 
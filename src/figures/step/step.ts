@@ -1,17 +1,19 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { makeFinalKeyframe, ccwRadsBetween } from '../../types';
-import { PROTO_DANCER_IDS, copyDancers, resolveHeading, resolveFacing } from '../../generateUtils';
+import { PROTO_DANCER_IDS, resolveHeading, resolveFacing } from '../../generateUtils';
 
 export function finalStep(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'step' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const id of PROTO_DANCER_IDS) {
     if (!scope.has(id)) continue;
     const d = prev.dancers[id];
     const heading = resolveHeading(instr.direction, d, id, prev.dancers);
-    dancers[id].pos = d.pos.add(heading.multiply(instr.distance));
     const base = resolveFacing(instr.facing, d, id, prev.dancers);
-    // offset is CW radians; vecti rotateByRadians is CCW, so negate
-    dancers[id].facing = base.rotateByRadians(-instr.facingOffset);
+    dancers[id] = {
+      pos: d.pos.add(heading.multiply(instr.distance)),
+      // offset is CW radians; vecti rotateByRadians is CCW, so negate
+      facing: base.rotateByRadians(-instr.facingOffset),
+    };
   }
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
@@ -23,17 +25,28 @@ export function finalStep(prev: Keyframe, instr: Extract<AtomicInstruction, { ty
 export function generateStep(prev: Keyframe, final: FinalKeyframe, instr: Extract<AtomicInstruction, { type: 'step' }>, scope: Set<ProtoDancerId>): Keyframe[] {
   const nFrames = Math.max(1, Math.round(instr.beats / 0.25));
 
+  // Each scoped dancer moves along a fixed segment and turns through a fixed angle,
+  // so describe those once and only evaluate them per frame.
+  const segments = PROTO_DANCER_IDS.filter(id => scope.has(id)).map(id => {
+    const start = prev.dancers[id];
+    return {
+      id,
+      start,
+      disp: final.dancers[id].pos.subtract(start.pos),
+      turn: ccwRadsBetween(start.facing, final.dancers[id].facing),
+    };
+  });
+
   const keyframes: Keyframe[] = [];
   for (let i = 1; i < nFrames; i++) {
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
-    const dancers = copyDancers(prev.dancers);
-    for (const id of PROTO_DANCER_IDS) {
-      if (!scope.has(id)) continue;
-      dancers[id].pos = prev.dancers[id].pos.add(
-        final.dancers[id].pos.subtract(prev.dancers[id].pos).multiply(t),
-      );
-      dancers[id].facing = prev.dancers[id].facing.rotateByRadians(ccwRadsBetween(prev.dancers[id].facing, final.dancers[id].facing) * t);
+    const dancers = { ...prev.dancers };
+    for (const { id, start, disp, turn } of segments) {
+      dancers[id] = {
+        pos: start.pos.add(disp.multiply(t)),
+        facing: start.facing.rotateByRadians(turn * t),
+      };
     }
     keyframes.push({ beat, dancers, hands: prev.hands });
   }
@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId, HandConnection, DancerId } from '../../types';
 import { Vector, headingAngle, makeFinalKeyframe, dancerPosition, ccwRadsBetween } from '../../types';
-import { copyDancers, resolveFacing, resolvePairs, isLark } from '../../generateUtils';
+import { resolveFacing, resolvePairs, isLark } from '../../generateUtils';
 
 const FRONT = 0.15;
 const RIGHT = 0.1;
@@ -22,6 +22,7 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'swing'
   const pairMap = resolvePairs(instr.relationship, prev.dancers, scope, { pairRoles: 'different' });
 
   const pairs: SwingPair[] = [];
+  const baseRotation = (Math.PI / 2) * instr.beats;
 
   for (const [proto, foil] of pairMap) {
 
@@ -29,14 +30,12 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'swing'
     const foilState = dancerPosition(foil, prev.dancers);
     const center = protoState.pos.add(foilState.pos).multiply(0.5);
 
-    const larkDelta = protoState.pos.subtract(center);
-    const thetaLark = Math.atan2(larkDelta.x, larkDelta.y);
+    const initOffsetFromCenter = protoState.pos.subtract(center);
+    const thetaLark = Math.atan2(initOffsetFromCenter.x, initOffsetFromCenter.y);
     const f0 = thetaLark - PHASE_OFFSET;
 
-    const initOffsetFromCenter = protoState.pos.subtract(center);
     const endFacing = resolveFacing(instr.endFacing, protoState, proto, prev.dancers);
 
-    const baseRotation = (Math.PI / 2) * instr.beats;
     const neededRads = headingAngle(endFacing) - f0;
     const nRots = Math.round((baseRotation - neededRads) / (2 * Math.PI));
     const totalRotation = neededRads + nRots * 2 * Math.PI;
@@ -59,10 +58,12 @@ function setup(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'swing'
 export function finalSwing(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'swing' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const { pairs, swingHands } = setup(prev, instr, scope);
 
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const { proto, center, endFacing } of pairs) {
-    dancers[proto].pos = center.add(endFacing.multiply(0.5).rotateByDegrees(isLark(proto) ? 90 : -90));
-    dancers[proto].facing = endFacing;
+    dancers[proto] = {
+      pos: center.add(endFacing.multiply(0.5).rotateByDegrees(isLark(proto) ? 90 : -90)),
+      facing: endFacing,
+    };
   }
 
   // Swing hands are dropped at the end
@@ -1,6 +1,6 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, HandConnection, ProtoDancerId } from '../../types';
 import { dancerPosition, makeFinalKeyframe } from '../../types';
-import { PROTO_DANCER_IDS, copyDancers, resolveRelationship, resolveInsideHand } from '../../generateUtils';
+import { PROTO_DANCER_IDS, resolveRelationship, resolveInsideHand } from '../../generateUtils';
 
 export function finalTakeHands(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'take_hands' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
   const newHands: HandConnection[] = [...prev.hands];
@@ -35,7 +35,7 @@ export function finalTakeHands(prev: Keyframe, instr: Extract<AtomicInstruction,
   }
   return makeFinalKeyframe({
     beat: prev.beat + instr.beats,
-    dancers: copyDancers(prev.dancers),
+    dancers: prev.dancers,
     hands: newHands,
   });
 }
@@ -1,11 +1,11 @@
 import type { Keyframe, FinalKeyframe, AtomicInstruction, ProtoDancerId } from '../../types';
 import { makeFinalKeyframe } from '../../types';
-import { copyDancers, isLark } from '../../generateUtils';
+import { isLark, rotateByCosSin } from '../../generateUtils';
 
 export function finalTurnAlone(prev: Keyframe, instr: Extract<AtomicInstruction, { type: 'turn_alone' }>, scope: Set<ProtoDancerId>): FinalKeyframe {
-  const dancers = copyDancers(prev.dancers);
+  const dancers = { ...prev.dancers };
   for (const id of scope) {
-    dancers[id].facing = dancers[id].facing.rotateByDegrees(180);
+    dancers[id] = { pos: prev.dancers[id].pos, facing: prev.dancers[id].facing.rotateByDegrees(180) };
   }
   return makeFinalKeyframe({ beat: prev.beat + instr.beats, dancers, hands: prev.hands });
 }
@@ -17,9 +17,13 @@ export function generateTurnAlone(prev: Keyframe, _final: FinalKeyframe, instr:
   for (let i = 1; i < nFrames; i++) {
     const t = i / nFrames;
     const beat = prev.beat + t * instr.beats;
-    const dancers = copyDancers(prev.dancers);
+    // Larks turn CW and robins CCW by the same angle, so they share one cos/sin
+    const cos = Math.cos(Math.PI * t);
+    const sin = Math.sin(Math.PI * t);
+    // Positions don't change, and unscoped dancers keep sharing prev's states.
+    const dancers = { ...prev.dancers };
     for (const id of scope) {
-      dancers[id].facing = prev.dancers[id].facing.rotateByDegrees(180 * t * (isLark(id) ? -1 : 1));
+      dancers[id] = { pos: prev.dancers[id].pos, facing: rotateByCosSin(prev.dancers[id].facing, cos, isLark(id) ? -sin : sin) };
     }
     result.push({ beat, dancers, hands: prev.hands });
   }
@@ -1,5 +1,5 @@
 import type { Instruction, AtomicInstruction, Keyframe, FinalKeyframe, HandConnection, ProtoDancerId, InitFormation, InstructionId } from './types';
-import { Vector, dancerPosition, ProtoDancerIdSchema, buildDancerRecord, splitLists, NORTH, EAST, SOUTH, WEST } from './types';
+import { Vector, parseDancerId, ProtoDancerIdSchema, InstructionSchema, buildDancerRecord, splitLists, instructionDuration, NORTH, EAST, SOUTH, WEST } from './types';
 import { assertNever } from './utils';
 import { ALL_DANCERS, SPLIT_GROUPS } from './generateUtils';
 
@@ -146,7 +146,9 @@ function processAtomicInstruction(prev: Keyframe, instr: AtomicInstruction, scop
   } catch {
     intermediates = [];
   }
-  return [...intermediates, final];
+  // Figures return fresh arrays, so append in place rather than copying.
+  intermediates.push(final);
+  return intermediates;
 }
 
 function processInstructions(prev: Keyframe, instructions: AtomicInstruction[], scope: Set<ProtoDancerId>): Keyframe[] {
@@ -174,17 +176,13 @@ function processInstructions(prev: Keyframe, instructions: AtomicInstruction[],
 
 // --- Split generation ---
 
-/** Find the last keyframe at or before the given beat. */
-function sampleAtBeat(timeline: Keyframe[], beat: number): Keyframe | null {
-  let best: Keyframe | null = null;
-  for (const kf of timeline) {
-    if (kf.beat <= beat + 1e-9) {
-      best = kf;
-    } else {
-      break;
-    }
+/** Advance `cursor` to the index of the last keyframe at or before the given beat
+ *  (-1 if there is none). Beats must be queried in nondecreasing order. */
+function advanceToBeat(timeline: Keyframe[], cursor: number, beat: number): number {
+  while (cursor + 1 < timeline.length && timeline[cursor + 1].beat <= beat + 1e-9) {
+    cursor++;
   }
-  return best;
+  return cursor;
 }
 
 function mergeSplitTimelines(
@@ -197,38 +195,56 @@ function mergeSplitTimelines(
     return [];
   }
 
-  // Collect all unique beat values
-  const beatSet = new Set<number>();
-  for (const kf of timelineA) beatSet.add(kf.beat);
-  for (const kf of timelineB) beatSet.add(kf.beat);
-  const sortedBeats = [...beatSet].sort((a, b) => a - b);
+  // Collect all unique beat values. Both timelines are already in beat order,
+  // so merge them directly and drop repeats by comparing with the last beat kept.
+  const sortedBeats: number[] = [];
+  for (let a = 0, b = 0; a < timelineA.length || b < timelineB.length;) {
+    const beat = b >= timelineB.length || (a < timelineA.length && timelineA[a].beat <= timelineB[b].beat)
+      ? timelineA[a++].beat
+      : timelineB[b++].beat;
+    if (sortedBeats.length === 0 || sortedBeats[sortedBeats.length - 1] !== beat) {
+      sortedBeats.push(beat);
+    }
+  }
 
   const merged: Keyframe[] = [];
+  let iA = -1;
+  let iB = -1;
+  let lastHandsA: HandConnection[] | null = null;
+  let lastHandsB: HandConnection[] | null = null;
+  let hands: HandConnection[] = [];
   for (const beat of sortedBeats) {
-    const kfA = sampleAtBeat(timelineA, beat);
-    const kfB = sampleAtBeat(timelineB, beat);
-
-    const dancers = buildDancerRecord(id => {
-      const src = groupA.has(id)
-        ? (kfA ? kfA.dancers[id] : prev.dancers[id])
-        : (kfB ? kfB.dancers[id] : prev.dancers[id]);
-      return { pos: src.pos, facing: src.facing };
-    });
-
-    // Merge hands: combine from both timelines, dedup by (a,b) pair
+    iA = advanceToBeat(timelineA, iA, beat);
+    iB = advanceToBeat(timelineB, iB, beat);
+    const kfA = iA >= 0 ? timelineA[iA] : null;
+    const kfB = iB >= 0 ? timelineB[iB] : null;
+
+    // Dancer states are read-only once emitted, so take them by reference.
+    const dancers = buildDancerRecord(id => groupA.has(id)
+      ? (kfA ? kfA.dancers[id] : prev.dancers[id])
+      : (kfB ? kfB.dancers[id] : prev.dancers[id]));
+
+    // Merge hands: combine from both timelines, dedup by (a,b) pair.
+    // Figures share one hands array across their frames, so only re-merge
+    // when either side actually hands us a different array.
     const handsA = kfA ? kfA.hands : prev.hands;
     const handsB = kfB ? kfB.hands : prev.hands;
-    const handMap = new Map<string, HandConnection>();
-    for (const h of handsA) {
-      const key = h.a < h.b ? `${h.a}:${h.b}` : `${h.b}:${h.a}`;
-      handMap.set(key, h);
-    }
-    for (const h of handsB) {
-      const key = h.a < h.b ? `${h.a}:${h.b}` : `${h.b}:${h.a}`;
-      handMap.set(key, h);
+    if (handsA !== lastHandsA || handsB !== lastHandsB) {
+      const handMap = new Map<string, HandConnection>();
+      for (const h of handsA) {
+        const key = h.a < h.b ? `${h.a}:${h.b}` : `${h.b}:${h.a}`;
+        handMap.set(key, h);
+      }
+      for (const h of handsB) {
+        const key = h.a < h.b ? `${h.a}:${h.b}` : `${h.b}:${h.a}`;
+        handMap.set(key, h);
+      }
+      hands = [...handMap.values()];
+      lastHandsA = handsA;
+      lastHandsB = handsB;
     }
 
-    merged.push({ beat, dancers, hands: [...handMap.values()] });
+    merged.push({ beat, dancers, hands });
   }
 
   return merged;
@@ -269,17 +285,6 @@ function generateSplit(prev: Keyframe, instr: Extract<Instruction, { type: 'spli
 
 // --- Top-level generator ---
 
-function instructionDuration(instr: Instruction): number {
-  if (instr.type === 'split') {
-    const [listA, listB] = splitLists(instr);
-    return Math.max(
-      listA.reduce((s, i) => s + i.beats, 0),
-      listB.reduce((s, i) => s + i.beats, 0)
-    );
-  }
-  return instr.beats;
-}
-
 /** Flatten instructions into leaf-level beat ranges. */
 function buildBeatRanges(instructions: Instruction[]): { id: InstructionId; start: number; end: number }[] {
   const ranges: { id: InstructionId; start: number; end: number }[] = [];
@@ -300,22 +305,32 @@ export function validateHandDistances(
   const ranges = buildBeatRanges(instructions);
 
   const warnings = new Map<InstructionId, string>();
+  const maxDistanceSq = maxDistance * maxDistance;
+  // Keyframes come in beat order, so the owning range only ever moves forward.
+  let rangeIdx = 0;
+  let lastBeat = -Infinity;
 
   for (const kf of keyframes) {
+    if (kf.beat < lastBeat) rangeIdx = 0;
+    lastBeat = kf.beat;
+    while (rangeIdx < ranges.length && kf.beat > ranges[rangeIdx].end + 1e-9) rangeIdx++;
+
+    // The instruction owning this beat, if any; once it has a warning,
+    // nothing in this keyframe can add another, so skip the distance work.
+    const r = ranges[rangeIdx];
+    if (!r || kf.beat < r.start - 1e-9 || warnings.has(r.id)) continue;
+
     for (const hand of kf.hands) {
-      const posA = dancerPosition(hand.a, kf.dancers);
-      const posB = dancerPosition(hand.b, kf.dancers);
-      const dist = posA.pos.subtract(posB.pos).length();
-      if (dist > maxDistance) {
-        // Find the instruction owning this beat
-        for (const r of ranges) {
-          if (kf.beat >= r.start - 1e-9 && kf.beat <= r.end + 1e-9) {
-            if (!warnings.has(r.id)) {
-              warnings.set(r.id, `Hands too far apart (${dist.toFixed(2)}m)`);
-            }
-            break;
-          }
-        }
+      // Work in scalars and squared distance; only violations need the real distance.
+      const posA = kf.dancers[hand.a].pos;
+      const { proto: protoB, offset: offsetB } = parseDancerId(hand.b);
+      const posB = kf.dancers[protoB].pos;
+      const dx = posA.x - posB.x;
+      const dy = posA.y - (posB.y + offsetB * 2);
+      const distSq = dx * dx + dy * dy;
+      if (distSq > maxDistanceSq) {
+        warnings.set(r.id, `Hands too far apart (${Math.sqrt(distSq).toFixed(2)}m)`);
+        break;
       }
     }
   }
@@ -334,14 +349,14 @@ export function validateProgression(
   const expectedDy = progression;
   const problems: string[] = [];
   for (const id of PROTO_DANCER_IDS) {
-    const sign = UPS.has(id) ? 1 : -1;
-    const expectedX = init.dancers[id].pos.x;
-    const expectedY = init.dancers[id].pos.y + sign * expectedDy;
-    const dx = final.dancers[id].pos.x - expectedX;
-    const dy = final.dancers[id].pos.y - expectedY;
-    const dist = Math.hypot(dx, dy);
-    if (dist > 0.05) {
-      problems.push(`${id} started at (${init.dancers[id].pos.x.toFixed(2)}, ${init.dancers[id].pos.y.toFixed(2)}), should have ended at (${expectedX.toFixed(2)}, ${expectedY.toFixed(2)}), but actually ended at (${final.dancers[id].pos.x.toFixed(2)}, ${final.dancers[id].pos.y.toFixed(2)})`);
+    const start = init.dancers[id].pos;
+    const end = final.dancers[id].pos;
+    const expectedX = start.x;
+    const expectedY = start.y + (UPS.has(id) ? expectedDy : -expectedDy);
+    const dx = end.x - expectedX;
+    const dy = end.y - expectedY;
+    if (dx * dx + dy * dy > 0.05 * 0.05) {
+      problems.push(`${id} started at (${start.x.toFixed(2)}, ${start.y.toFixed(2)}), should have ended at (${expectedX.toFixed(2)}, ${expectedY.toFixed(2)}), but actually ended at (${end.x.toFixed(2)}, ${end.y.toFixed(2)})`);
     }
   }
   if (problems.length === 0) return null;
@@ -388,22 +403,23 @@ export function generateAllKeyframes(instructions: Instruction[], initFormation:
   return { keyframes, error: null };
 }
 
-/** Find the beat at which a specific instruction starts, by walking the list. */
-export function findInstructionStartBeat(instructions: Instruction[], targetId: InstructionId): number | null {
+/** Find an instruction together with its start beat and dancer scope (ALL_DANCERS unless inside a split). */
+export function locateInstruction(
+  instructions: Instruction[],
+  targetId: InstructionId,
+): { instr: Instruction; startBeat: number; scope: Set<ProtoDancerId> } | null {
   let beat = 0;
   for (const instr of instructions) {
-    if (instr.id === targetId) return beat;
+    if (instr.id === targetId) return { instr, startBeat: beat, scope: ALL_DANCERS };
     if (instr.type === 'split') {
-      const [listA, listB] = splitLists(instr);
-      let b = beat;
-      for (const sub of listA) {
-        if (sub.id === targetId) return b;
-        b += sub.beats;
-      }
-      b = beat;
-      for (const sub of listB) {
-        if (sub.id === targetId) return b;
-        b += sub.beats;
+      const groups = SPLIT_GROUPS[instr.by];
+      const lists = splitLists(instr);
+      for (let g = 0; g < lists.length; g++) {
+        let b = beat;
+        for (const sub of lists[g]) {
+          if (sub.id === targetId) return { instr: InstructionSchema.parse(sub), startBeat: b, scope: groups[g] };
+          b += sub.beats;
+        }
       }
     }
     beat += instructionDuration(instr);
@@ -411,24 +427,6 @@ export function findInstructionStartBeat(instructions: Instruction[], targetId:
   return null;
 }
 
-/** Find the dancer scope for a specific instruction (ALL_DANCERS unless inside a split). */
-export function findInstructionScope(instructions: Instruction[], targetId: InstructionId): Set<ProtoDancerId> {
-  for (const instr of instructions) {
-    if (instr.id === targetId) return ALL_DANCERS;
-    if (instr.type === 'split') {
-      const [groupA, groupB] = SPLIT_GROUPS[instr.by];
-      const [listA, listB] = splitLists(instr);
-      for (const sub of listA) {
-        if (sub.id === targetId) return groupA;
-      }
-      for (const sub of listB) {
-        if (sub.id === targetId) return groupB;
-      }
-    }
-  }
-  return ALL_DANCERS;
-}
-
 /** Generate preview keyframes for a single instruction given a starting keyframe and scope.
  *  Returns null if generation fails (e.g., parse error in the instruction). */
 export function generateInstructionPreview(
@@ -1,6 +1,6 @@
 import { describe, it, expect } from 'vitest';
-import { resolveRelationship, PROTO_DANCER_IDS, getRelationship } from './generateUtils';
-import { BaseRelationshipSchema, makeDancerId, parseDancerId } from './types';
+import { resolveRelationship, PROTO_DANCER_IDS, getRelationship, rotateByCosSin } from './generateUtils';
+import { BaseRelationshipSchema, Vector, makeDancerId, parseDancerId } from './types';
 import type { BaseRelationship } from './types';
 
 describe('resolveRelationship symmetry', () => {
@@ -35,4 +35,16 @@ describe('getRelationship', () => {
     expect(getRelationship('down_robin_10', 'down_lark_13')).toEqual({ base: 'partner', offset: -3 });
     expect(getRelationship('down_robin_10', 'down_robin_13')).toBeUndefined();
   });
-});
\ No newline at end of file
+});
+
+describe('rotateByCosSin', () => {
+  it('matches rotateByRadians', () => {
+    const v = new Vector(0.3, -1.2);
+    for (const rad of [0, 0.5, Math.PI / 2, 2, -3]) {
+      const expected = v.rotateByRadians(rad);
+      const actual = rotateByCosSin(v, Math.cos(rad), Math.sin(rad));
+      expect(actual.x).toBeCloseTo(expected.x, 10);
+      expect(actual.y).toBeCloseTo(expected.y, 10);
+    }
+  });
+});
@@ -1,4 +1,4 @@
-import type { Relationship, RelativeDirection, DancerState, ProtoDancerId, DancerId, DirectionalRelationship } from './types';
+import type { Relationship, RelativeDirection, DancerState, MutableDancerState, ProtoDancerId, DancerId, DirectionalRelationship } from './types';
 import { Vector, makeDancerId, parseDancerId, dancerPosition, ProtoDancerIdSchema, buildDancerRecord, NORTH, EAST, SOUTH, WEST, otherRole, otherDir } from './types';
 import { assertNever } from './utils';
 
@@ -13,17 +13,37 @@ export const SPLIT_GROUPS: Record<'role' | 'position', [Set<ProtoDancerId>, Set<
 
 export const ALL_DANCERS = new Set<ProtoDancerId>(PROTO_DANCER_IDS);
 
-export function copyDancers(dancers: Record<ProtoDancerId, DancerState>): Record<ProtoDancerId, DancerState> {
+/** Copy each dancer's state so its fields can be reassigned in place.
+ *  Frames that only replace some dancers use the DancerState overlay instead. */
+export function copyDancers(dancers: Record<ProtoDancerId, DancerState>): Record<ProtoDancerId, MutableDancerState> {
   return buildDancerRecord(id => {
     const d = dancers[id];
     return { pos: d.pos, facing: d.facing };
   });
 }
 
+// Relationships are resolved for the same few (relationship, dancer) combinations
+// by every figure during generation and again during validation, so remember the answers.
+// Edits can keep introducing new offsets, so start over once the cache gets large;
+// one generation's working set is far smaller than the cap.
+const resolvedRelationships = new Map<string, DancerId>();
+const MAX_RESOLVED_RELATIONSHIPS = 1024;
+
 /** Resolve a relationship from a specific dancer's perspective.
  *  Returns the DancerId of the target, which may be in an different hands-four.
  */
 export function resolveRelationship(relationship: Relationship, id: DancerId): DancerId {
+  const key = `${relationship.base}:${relationship.offset}:${id}`;
+  let target = resolvedRelationships.get(key);
+  if (target === undefined) {
+    target = computeRelationshipTarget(relationship, id);
+    if (resolvedRelationships.size >= MAX_RESOLVED_RELATIONSHIPS) resolvedRelationships.clear();
+    resolvedRelationships.set(key, target);
+  }
+  return target;
+}
+
+function computeRelationshipTarget(relationship: Relationship, id: DancerId): DancerId {
   const { dir, role, offset } = parseDancerId(id);
   const nHandsFoursAhead = (dir==='up' ? 1 : -1) * relationship.offset;
   switch (relationship.base) {
@@ -55,10 +75,10 @@ export function resolvePairs(
   }
 
   const [larks] = SPLIT_GROUPS.role;
+  const relLabel = `${relationship.base}(offset=${relationship.offset})`;
   for (const [id, targetDancerId] of result) {
     const { proto: targetProto } = parseDancerId(targetDancerId);
 
-    const relLabel = `${relationship.base}(offset=${relationship.offset})`;
     if (!scope.has(targetProto)) {
       throw new Error(
         `${id}'s ${relLabel} resolves to ${targetDancerId}, whose proto ${targetProto} is not in scope`,
@@ -71,9 +91,10 @@ export function resolvePairs(
         `${relLabel} is not symmetric: ${id} → ${targetProto} but ${targetProto} has no resolution`,
       );
     }
-    if (parseDancerId(reverseTarget).proto !== id) {
+    const { proto: reverseProto } = parseDancerId(reverseTarget);
+    if (reverseProto !== id) {
       throw new Error(
-        `${relLabel} is not symmetric: ${id} → ${targetProto} but ${targetProto} → ${parseDancerId(reverseTarget).proto}`,
+        `${relLabel} is not symmetric: ${id} → ${targetProto} but ${targetProto} → ${reverseProto}`,
       );
     }
 
@@ -92,6 +113,30 @@ export function resolvePairs(
   return result;
 }
 
+/** Path along an ellipse whose major axis runs from `a` to `b`, as a function of phi.
+ *  phi=0 → a, phi=π → b, phi=2π → a again.
+ *  The ellipse geometry is computed once, so frame loops only pay for the trig. */
+export function ellipsePath(
+  a: Vector,
+  b: Vector,
+  semiMinor: number,
+): (phi: number) => Vector {
+  const c = a.add(b).multiply(0.5);
+  const d = a.subtract(c);
+  const semiMajor = d.length();
+  if (semiMajor < 1e-9) return () => c;
+  const sinStart = d.x / semiMajor;
+  const cosStart = d.y / semiMajor;
+  return phi => {
+    const cosPhi = Math.cos(phi);
+    const sinPhi = Math.sin(phi);
+    return new Vector(
+      c.x + semiMajor * cosPhi * sinStart + semiMinor * sinPhi * cosStart,
+      c.y + semiMajor * cosPhi * cosStart - semiMinor * sinPhi * sinStart,
+    );
+  };
+}
+
 /** Position on an ellipse whose major axis runs from `a` to `b`.
  *  phi=0 → a, phi=π → b, phi=2π → a again. */
 export function ellipsePosition(
@@ -114,6 +159,12 @@ export function ellipsePosition(
   );
 }
 
+/** Rotate `v` CCW by the angle with the given cosine and sine.
+ *  Lets frame loops compute the trig once per frame and share it across dancers. */
+export function rotateByCosSin(v: Vector, cos: number, sin: number): Vector {
+  return new Vector(v.x * cos - v.y * sin, v.x * sin + v.y * cos);
+}
+
 /** Resolve a RelativeDirection to a unit heading vector for a specific dancer. */
 export function resolveHeading(dir: RelativeDirection, d: DancerState, id: ProtoDancerId, dancers: Record<ProtoDancerId, DancerState>): Vector {
   if (dir.kind === 'direction') {
@@ -146,8 +197,7 @@ export function resolveFacing(dir: RelativeDirection, d: DancerState, id: ProtoD
  *  Uses cross product of facing and direction-to-target.
  *  Throws if the target is directly in front of or behind the dancer. */
 export function resolveInsideHand(dancer: DancerState, target: DancerState): 'left' | 'right' {
-  const delta = target.pos.subtract(dancer.pos);
-  const cross = dancer.facing.x * delta.y - dancer.facing.y * delta.x;
+  const cross = dancer.facing.x * (target.pos.y - dancer.pos.y) - dancer.facing.y * (target.pos.x - dancer.pos.x);
   if (Math.abs(cross) < 1e-9) {
     throw new Error('Cannot determine inside hand: target is neither to the left nor to the right');
   }
@@ -158,8 +208,7 @@ export function resolveInsideHand(dancer: DancerState, target: DancerState): 'le
  *  Uses the cross product of facing direction and direction to target.
  *  Falls back on angular ordering when they are directly in front/behind. */
 export function insideHandInRing(dancer: DancerState, target: DancerState, dancerAngle: number, targetAngle: number): 'left' | 'right' {
-  const delta = target.pos.subtract(dancer.pos);
-  const cross = dancer.facing.x * delta.y - dancer.facing.y * delta.x;
+  const cross = dancer.facing.x * (target.pos.y - dancer.pos.y) - dancer.facing.y * (target.pos.x - dancer.pos.x);
   if (Math.abs(cross) > 1e-9) {
     return cross < 0 ? 'right' : 'left';
   }
@@ -192,33 +241,40 @@ export function findDancerOnSide(
   const heading = d.facing.rotateByRadians(angleOffset);
 
   let bestScore = Infinity;
-  let bestTarget: { dancerId: DancerId; dist: number } | null = null;
+  let best: { otherId: ProtoDancerId; offset: number; dist: number } | null = null;
 
   for (const otherId of PROTO_DANCER_IDS) {
     if (otherId === id) continue;
-    const dyBase = dancers[otherId].pos.y - d.pos.y;
+    const base = dancers[otherId].pos;
+    // Every copy of otherId shares the same x-displacement.
+    const dx = base.x - d.pos.x;
+    if (Math.abs(dx) > 1.2) continue;
+    const dyBase = base.y - d.pos.y;
     const oBest = Math.round(-dyBase / 2);
     for (let o = oBest - 2; o <= oBest + 2; o++) {
-      const targetId = makeDancerId(otherId, o);
-      const targetPos = dancerPosition(targetId, dancers);
-      const disp = targetPos.pos.subtract(d.pos);
-      const r = disp.length();
-      if (r > 1.2 || r < 1e-9) continue;
-
-      const cosTheta = heading.dot(disp) / r;
-      if (cosTheta < 0) continue;
-      const cos2Theta = 2 * cosTheta * cosTheta - 1;
+      // Copies are 2m apart along y, so most offsets are out of range on
+      // their y-distance alone; skip those before doing any more work.
+      const dy = (base.y + o * 2) - d.pos.y;
+      if (Math.abs(dy) > 1.2) continue;
+      // Filter on squared distance; only survivors need the square root for scoring.
+      const r2 = dx * dx + dy * dy;
+      if (r2 > 1.2 * 1.2 || r2 < 1e-18) continue;
+
+      const dot = heading.x * dx + heading.y * dy;
+      if (dot < 0) continue;
+      const cos2Theta = 2 * dot * dot / r2 - 1;
       if (cos2Theta < 0.01) continue;
 
+      const r = Math.sqrt(r2);
       const score = r / cos2Theta;
       if (score < bestScore) {
         bestScore = score;
-        bestTarget = { dancerId: targetId, dist: r };
+        best = { otherId, offset: o, dist: r };
       }
     }
   }
 
-  return bestTarget;
+  return best && { dancerId: makeDancerId(best.otherId, best.offset), dist: best.dist };
 }
 
 /** Angle between two unit facing vectors, in radians [0, π]. */
@@ -251,5 +307,13 @@ export function getRelationship(a: DancerId, b: DancerId): Relationship | undefi
 }
 
 export function averagePos(positions: Vector[]): Vector {
-  return positions.reduce((a, b) => a.add(b), new Vector(0, 0)).multiply(1 / positions.length);
+  // Sum plain numbers rather than allocating a Vector per addition
+  let x = 0;
+  let y = 0;
+  for (const p of positions) {
+    x += p.x;
+    y += p.y;
+  }
+  const k = 1 / positions.length;
+  return new Vector(x * k, y * k);
 }
@@ -283,4 +283,97 @@ describe('getFrameAtBeat', () => {
       expect(smoothedNoWrap.dancers.up_lark_0.pos.x).toBeCloseTo(0);
     });
   });
+
+  describe('keyframe lookup', () => {
+    // Irregular spacing, with more keyframes than the cursor will step over,
+    // so both the cursor walk and the binary-search fallback get exercised.
+    const beats = [0, 1, 1.5, 4, 4.25, 7, 8, 12, 12.5, 16, 20, 24, 30];
+    function irregularKeyframes(offset = 0): Keyframe[] {
+      const z: [number, number, number] = [0, 0, 0];
+      return beats.map((b, i) => makeKeyframe(b, { up_lark_0: [i * i + offset, i, 0], up_robin_0: z, down_lark_0: z, down_robin_0: z }));
+    }
+
+    // Reference: clamp, then binary search for the surrounding frames and lerp.
+    function expectedX(kfs: Keyframe[], beat: number): number {
+      const x = (k: Keyframe) => k.dancers.up_lark_0.pos.x;
+      if (beat <= kfs[0].beat) return x(kfs[0]);
+      if (beat >= kfs[kfs.length - 1].beat) return x(kfs[kfs.length - 1]);
+      let lo = 0, hi = kfs.length - 1;
+      while (lo < hi - 1) {
+        const mid = (lo + hi) >> 1;
+        if (kfs[mid].beat <= beat) lo = mid;
+        else hi = mid;
+      }
+      const t = (beat - kfs[lo].beat) / (kfs[lo + 1].beat - kfs[lo].beat);
+      return x(kfs[lo]) + (x(kfs[lo + 1]) - x(kfs[lo])) * t;
+    }
+
+    function sweep(from: number, to: number, step: number): number[] {
+      const out: number[] = [];
+      for (let b = from; step > 0 ? b <= to : b >= to; b += step) out.push(b);
+      return out;
+    }
+
+    it('matches binary search for beats going forward', () => {
+      const kfs = irregularKeyframes();
+      for (const b of sweep(0, 30, 0.125)) {
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(kfs, b));
+      }
+    });
+
+    it('matches binary search for beats going backward', () => {
+      const kfs = irregularKeyframes();
+      for (const b of sweep(30, 0, -0.125)) {
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(kfs, b));
+      }
+    });
+
+    it('matches binary search for beats jumping around', () => {
+      const kfs = irregularKeyframes();
+      for (const b of [29, 0.5, 12.25, 12.75, 4.1, 25, 1.2, 18, 7.5, 0.1]) {
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(kfs, b));
+      }
+    });
+
+    it('returns exact keyframe values on keyframe boundaries', () => {
+      const kfs = irregularKeyframes();
+      for (const k of [...kfs, ...[...kfs].reverse()]) {
+        const frame = getFrameAtBeat(kfs, k.beat, 0, 64, 0, false)!;
+        expect(frame.dancers.up_lark_0.pos.x).toBeCloseTo(k.dancers.up_lark_0.pos.x);
+        expect(frame.dancers.up_lark_0.pos.y).toBeCloseTo(k.dancers.up_lark_0.pos.y);
+      }
+    });
+
+    it('holds the last keyframe past the end', () => {
+      const kfs = irregularKeyframes();
+      const last = kfs[kfs.length - 1];
+      for (const b of [30, 31, 45, 63.9]) {
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, false)).toEqual(last);
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, true)).toEqual(last);
+      }
+      // Past the dance length, wrapping starts over from the beginning
+      for (const b of sweep(64, 94, 0.5)) {
+        expect(getFrameAtBeat(kfs, b, 0, 64, 0, true)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(kfs, b - 64));
+      }
+    });
+
+    it('keeps lookups independent across interleaved keyframe arrays', () => {
+      const a = irregularKeyframes();
+      const b = irregularKeyframes(100).slice(3);
+      for (const beat of sweep(0, 30, 0.375)) {
+        expect(getFrameAtBeat(a, beat, 0, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(a, beat));
+        expect(getFrameAtBeat(b, 30 - beat, 0, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(expectedX(b, 30 - beat));
+      }
+    });
+
+    it('smoothing averages the binary-search samples across the window', () => {
+      const kfs = irregularKeyframes();
+      const smoothness = 3;
+      for (const b of [...sweep(2, 28, 0.5), ...sweep(28, 2, -0.75)]) {
+        let sum = 0;
+        for (let i = 0; i < 10; i++) sum += expectedX(kfs, b - smoothness / 2 + i * smoothness / 9);
+        expect(getFrameAtBeat(kfs, b, smoothness, 64, 0, false)!.dancers.up_lark_0.pos.x).toBeCloseTo(sum / 10);
+      }
+    });
+  });
 });
@@ -8,6 +8,11 @@ const COLORS: Record<ProtoDancerId, { fill: string; stroke: string; label: strin
   down_robin_0: { fill: '#a92a2a', stroke: '#c94a4a', label: 'DR' },
 };
 
+const HEAD_LEN = 6;
+const HEAD_ANGLE = 0.4;
+const COS_HEAD_ANGLE = Math.cos(HEAD_ANGLE);
+const SIN_HEAD_ANGLE = Math.sin(HEAD_ANGLE);
+
 const MARGIN = 40;
 const PX_PER_METER = 103; // fixed scale: (700 - 80) / 6 ≈ 103
 
@@ -20,6 +25,12 @@ export class Renderer {
   private xRange: number;
   private yRange: number;
   private cameraY = 0;
+  // worldToCanvas is an axis-aligned affine map: canvas = world * scale + offset
+  // (y flipped). Keep its coefficients rather than re-deriving them per call.
+  private scaleX = 0;
+  private scaleY = 0;
+  private offsetX = 0;
+  private offsetY = 0;
   private trails: Partial<Record<ProtoDancerId, { x: number; y: number }[]>> = {};
   private trailLength = 20;
 
@@ -31,6 +42,7 @@ export class Renderer {
     this.usableH = height - 2 * MARGIN;
     this.yRange = this.usableH / PX_PER_METER;
     this.xRange = this.usableW / PX_PER_METER;
+    this.updateTransform();
   }
 
   resize(width: number, height: number) {
@@ -40,6 +52,14 @@ export class Renderer {
     this.usableH = height - 2 * MARGIN;
     this.yRange = this.usableH / PX_PER_METER;
     this.xRange = this.usableW / PX_PER_METER;
+    this.updateTransform();
+  }
+
+  private updateTransform() {
+    this.scaleX = this.usableW / this.xRange;
+    this.scaleY = this.usableH / this.yRange;
+    this.offsetX = MARGIN + this.usableW / 2;
+    this.offsetY = MARGIN + (this.cameraY + this.yRange / 2) * this.scaleY;
   }
 
   clearTrails() {
@@ -47,9 +67,7 @@ export class Renderer {
   }
 
   private worldToCanvas(wx: number, wy: number): [number, number] {
-    const cx = MARGIN + (wx + this.xRange / 2) / this.xRange * this.usableW;
-    const cy = MARGIN + ((this.cameraY + this.yRange / 2) - wy) / this.yRange * this.usableH;
-    return [cx, cy];
+    return [this.offsetX + wx * this.scaleX, this.offsetY - wy * this.scaleY];
   }
 
   drawFrame(frame: Keyframe, progressionRate: number) {
@@ -57,6 +75,7 @@ export class Renderer {
     ctx.clearRect(0, 0, this.width, this.height);
 
     this.cameraY = progressionRate * frame.beat;
+    this.updateTransform();
 
     const viewYMin = this.cameraY - this.yRange / 2;
     const viewYMax = this.cameraY + this.yRange / 2;
@@ -94,44 +113,47 @@ export class Renderer {
     const [arx, ary] = this.worldToCanvas(-this.xRange / 2 + 0.15, viewYMax - 0.3);
     ctx.fillText('\u2191 up', arx, ary);
 
+    // Hands and dancers are tiled every 2m to fill viewport
+    const firstCopy = Math.floor((viewYMin - 1) / 2) * 2;
+    const lastCopy = Math.ceil((viewYMax + 1) / 2) * 2;
+
     // Hand connections
     ctx.strokeStyle = '#666';
     ctx.lineWidth = 2;
     for (const h of frame.hands) {
       const da = dancerPosition(h.a, frame.dancers);
       const db = dancerPosition(h.b, frame.dancers);
-      this.drawHandsForAllCopies(da, h.ha, db, h.hb);
+      this.drawHandsForAllCopies(da, h.ha, db, h.hb, firstCopy, lastCopy);
     }
 
-    // Dancers tiled every 2m to fill viewport
-    const firstCopy = Math.floor((viewYMin - 1) / 2) * 2;
-    const lastCopy = Math.ceil((viewYMax + 1) / 2) * 2;
+    // Look each dancer up once; the loops below index into these arrays.
+    const ids = ProtoDancerIdSchema.options;
+    const states = ids.map(id => frame.dancers[id]);
+
     for (let offset = firstCopy; offset <= lastCopy; offset += 2) {
-      for (const id of ProtoDancerIdSchema.options) {
-        const d = frame.dancers[id];
-        this.drawDancer(id, d.pos.x, d.pos.y + offset, d.facing, offset === 0 ? 1.0 : 0.35);
+      for (let i = 0; i < ids.length; i++) {
+        const d = states[i];
+        this.drawDancer(ids[i], d.pos.x, d.pos.y + offset, d.facing, offset === 0 ? 1.0 : 0.35);
       }
     }
 
     // Update and draw trails
-    for (const id of ProtoDancerIdSchema.options) {
-      const d = frame.dancers[id];
-      if (!this.trails[id]) this.trails[id] = [];
-      this.trails[id]!.push({ x: d.pos.x, y: d.pos.y });
-      if (this.trails[id]!.length > this.trailLength) this.trails[id]!.shift();
-    }
+    for (let i = 0; i < ids.length; i++) {
+      const id = ids[i];
+      const d = states[i];
+      let trail = this.trails[id];
+      if (!trail) trail = this.trails[id] = [];
+      trail.push({ x: d.pos.x, y: d.pos.y });
+      if (trail.length > this.trailLength) trail.shift();
 
-    for (const id of ProtoDancerIdSchema.options) {
-      const trail = this.trails[id];
-      if (!trail) continue;
       const color = COLORS[id];
       ctx.strokeStyle = color.fill;
       ctx.lineWidth = 1;
       ctx.globalAlpha = 0.3;
       ctx.beginPath();
-      for (let i = 0; i < trail.length; i++) {
-        const [tcx, tcy] = this.worldToCanvas(trail[i].x, trail[i].y);
-        if (i === 0) ctx.moveTo(tcx, tcy);
+      for (let j = 0; j < trail.length; j++) {
+        const [tcx, tcy] = this.worldToCanvas(trail[j].x, trail[j].y);
+        if (j === 0) ctx.moveTo(tcx, tcy);
         else ctx.lineTo(tcx, tcy);
       }
       ctx.stroke();
@@ -147,12 +169,8 @@ export class Renderer {
     return [facing.y * sign * r, facing.x * sign * r];
   }
 
-  private drawHandsForAllCopies(da: DancerState, handA: 'left' | 'right', db: DancerState, handB: 'left' | 'right') {
+  private drawHandsForAllCopies(da: DancerState, handA: 'left' | 'right', db: DancerState, handB: 'left' | 'right', firstCopy: number, lastCopy: number) {
     const ctx = this.ctx;
-    const viewYMin = this.cameraY - this.yRange / 2;
-    const viewYMax = this.cameraY + this.yRange / 2;
-    const firstCopy = Math.floor((viewYMin - 1) / 2) * 2;
-    const lastCopy = Math.ceil((viewYMax + 1) / 2) * 2;
     const r = 14;
     const [dxA, dyA] = this.handAnchorOffset(da.facing, handA, r);
     const [dxB, dyB] = this.handAnchorOffset(db.facing, handB, r);
@@ -286,15 +304,18 @@ export class Renderer {
     ctx.lineTo(ax, ay);
     ctx.stroke();
 
-    // Arrowhead
-    const headLen = 6;
-    const headAngleVal = 0.4;
-    const angle = Math.atan2(ay - cy, ax - cx);
+    // Arrowhead: the arrow's screen direction is (facing.x, -facing.y), so
+    // rotate that by ±HEAD_ANGLE directly rather than going through atan2/cos/sin.
+    const len = Math.sqrt(facing.x * facing.x + facing.y * facing.y);
+    const ux = facing.x / len;
+    const uy = -facing.y / len;
+    const hx = ux * COS_HEAD_ANGLE, hy = uy * COS_HEAD_ANGLE;
+    const kx = ux * SIN_HEAD_ANGLE, ky = uy * SIN_HEAD_ANGLE;
     ctx.beginPath();
     ctx.moveTo(ax, ay);
-    ctx.lineTo(ax - headLen * Math.cos(angle - headAngleVal), ay - headLen * Math.sin(angle - headAngleVal));
+    ctx.lineTo(ax - HEAD_LEN * (hx + ky), ay - HEAD_LEN * (hy - kx));
     ctx.moveTo(ax, ay);
-    ctx.lineTo(ax - headLen * Math.cos(angle + headAngleVal), ay - headLen * Math.sin(angle + headAngleVal));
+    ctx.lineTo(ax - HEAD_LEN * (hx - ky), ay - HEAD_LEN * (hy + kx));
     ctx.stroke();
 
     // Label
@@ -315,8 +336,41 @@ function lerpFacing(a: Vector, b: Vector, t: number): Vector {
   return a.rotateByRadians(ccwRadsBetween(a, b) * t);
 }
 
+/** Index `lo` with keyframes[lo].beat <= beat < keyframes[lo + 1].beat.
+ *  Requires keyframes[0].beat < beat < keyframes[last].beat. */
+function bracketIndex(keyframes: Keyframe[], beat: number): number {
+  // Binary search for surrounding frames
+  let lo = 0, hi = keyframes.length - 1;
+  while (lo < hi - 1) {
+    const mid = (lo + hi) >> 1;
+    if (keyframes[mid].beat <= beat) lo = mid;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// The smoothing window asks for steadily increasing beats, so the surrounding
+// frames are usually the same as for the previous sample or just after them.
+// Each window keeps its own cursor (lo < 0 until the first lookup).
+type BracketCursor = { lo: number };
+const CURSOR_MAX_STEPS = 4;
+
+/** Like bracketIndex, but first tries stepping forward from the cursor. */
+function bracketIndexFrom(keyframes: Keyframe[], beat: number, cursor: BracketCursor): number {
+  if (cursor.lo >= 0 && keyframes[cursor.lo].beat <= beat) {
+    for (let lo = cursor.lo, steps = 0; lo + 1 < keyframes.length && steps < CURSOR_MAX_STEPS; lo++, steps++) {
+      if (keyframes[lo + 1].beat > beat) {
+        cursor.lo = lo;
+        return lo;
+      }
+    }
+  }
+  cursor.lo = bracketIndex(keyframes, beat);
+  return cursor.lo;
+}
+
 /** Linear interpolation between keyframes (no smoothing). */
-function rawFrameAtBeat(keyframes: Keyframe[], beat: number, danceLength: number = 64, progression: number = 0, wrap: boolean = true): Keyframe | null {
+function rawFrameAtBeat(keyframes: Keyframe[], beat: number, danceLength: number, progression: number, wrap: boolean, cursor?: BracketCursor): Keyframe | null {
   if (keyframes.length === 0) return null;
 
   let cycle = 0;
@@ -333,16 +387,9 @@ function rawFrameAtBeat(keyframes: Keyframe[], beat: number, danceLength: number
     if (beat >= keyframes[keyframes.length - 1].beat) return keyframes[keyframes.length - 1];
   }
 
-  // Binary search for surrounding frames
-  let lo = 0, hi = keyframes.length - 1;
-  while (lo < hi - 1) {
-    const mid = (lo + hi) >> 1;
-    if (keyframes[mid].beat <= beat) lo = mid;
-    else hi = mid;
-  }
-
+  const lo = cursor ? bracketIndexFrom(keyframes, beat, cursor) : bracketIndex(keyframes, beat);
   const f0 = keyframes[lo];
-  const f1 = keyframes[hi];
+  const f1 = keyframes[lo + 1];
   const t = (beat - f0.beat) / (f1.beat - f0.beat);
 
   const dancers = buildDancerRecord(id => {
@@ -393,8 +440,9 @@ export function getFrameAtBeat(keyframes: Keyframe[], beat: number, smoothness:
 
   // Collect all samples
   const samples: Keyframe[] = [];
+  const cursor: BracketCursor = { lo: -1 };
   for (let i = 0; i < SMOOTH_SAMPLES; i++) {
-    const s = rawFrameAtBeat(keyframes, start + i * step, danceLength, progression, wrap);
+    const s = rawFrameAtBeat(keyframes, start + i * step, danceLength, progression, wrap, cursor);
     if (!s) return null;
     samples.push(s);
   }
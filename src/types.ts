@@ -28,7 +28,25 @@ export type DancerId = z.infer<typeof DancerIdSchema>;
 // (the `satisfies` will fail if ProtoDancerId is not assignable to DancerId)
 undefined as unknown as ProtoDancerId satisfies DancerId;
 
-export function parseDancerId(id: DancerId): { proto: ProtoDancerId; dir: ProgressionDir; role: Role; offset: DancerOffset } {
+type ParsedDancerId = Readonly<{ proto: ProtoDancerId; dir: ProgressionDir; role: Role; offset: DancerOffset }>;
+
+// Generation and rendering parse the same handful of ids over and over, and each
+// parse runs several zod schemas, so parse the ids near the home hands-four up front.
+// Ids further out are rare and are parsed (and validated) on demand.
+const PRECOMPUTED_OFFSET_RANGE = 8;
+const parsedDancerIds = new Map<string, ParsedDancerId>();
+for (const dir of ProgressionDirSchema.options) {
+  for (const role of RoleSchema.options) {
+    const proto = ProtoDancerIdSchema.parse(`${dir}_${role}_0`);
+    for (let offset = -PRECOMPUTED_OFFSET_RANGE; offset <= PRECOMPUTED_OFFSET_RANGE; offset++) {
+      parsedDancerIds.set(`${dir}_${role}_${offset}`, { proto, dir, role, offset });
+    }
+  }
+}
+
+export function parseDancerId(id: DancerId): ParsedDancerId {
+  const cached = parsedDancerIds.get(id);
+  if (cached) return cached;
   const [dirStr, roleStr, offsetStr] = id.split('_');
   const dir = ProgressionDirSchema.parse(dirStr);
   const role = RoleSchema.parse(roleStr);
@@ -43,7 +61,10 @@ export function parseDancerId(id: DancerId): { proto: ProtoDancerId; dir: Progre
 
 export function makeDancerId(proto: ProtoDancerId | {dir: ProgressionDir, role: Role}, offset: number): DancerId {
   const {dir, role} = typeof proto === 'string' ? parseDancerId(proto) : proto;
-  return DancerIdSchema.parse(`${dir}_${role}_${offset}`);
+  const id = `${dir}_${role}_${offset}`;
+  // Precomputed ids are known to pass DancerIdSchema, and the template-literal check is the expensive part
+  if (parsedDancerIds.has(id)) return id as DancerId;
+  return DancerIdSchema.parse(id);
 }
 
 export function dancerPosition(id: DancerId, dancers: Record<ProtoDancerId, DancerState>): DancerState {
@@ -264,8 +285,14 @@ export const VectorSchema = z.instanceof(Vector);
 export const DancerStateSchema = z.object({
   pos: VectorSchema,
   facing: VectorSchema, // unit vector: NORTH = (0,1), EAST = (1,0)
-});
+}).readonly();
+/** Keyframes share dancer states freely, so they are read-only once emitted.
+ *  A frame that moves only some dancers spreads `{ ...prev.dancers }` and replaces
+ *  just those entries; everyone else keeps sharing prev's states. */
 export type DancerState = z.infer<typeof DancerStateSchema>;
+/** A private, writable copy of a DancerState (see copyDancers), for figures that
+ *  build a frame field by field before emitting it. */
+export type MutableDancerState = { -readonly [K in keyof DancerState]: DancerState[K] };
 
 // --- Direction constants (unit vectors) ---
 
@@ -285,13 +312,10 @@ export function headingAngle(v: Vector): number {
   return Math.atan2(v.x, v.y);
 }
 
+/** Signed CCW angle from `a` to `b`, in radians [-π, π].
+ *  atan2(cross, dot) lands in that range directly, with no wraparound fixup. */
 export function ccwRadsBetween(a: Vector, b: Vector): number {
-  const thetaA = Math.atan2(a.y, a.x);
-  const thetaB = Math.atan2(b.y, b.x);
-  let diff = thetaB - thetaA;
-  if (diff > Math.PI) diff -= 2 * Math.PI;
-  if (diff < -Math.PI) diff += 2 * Math.PI;
-  return diff;
+  return Math.atan2(a.x * b.y - a.y * b.x, a.x * b.x + a.y * b.y);
 }
 
 export const HandConnectionSchema = z.object({
@@ -299,7 +323,8 @@ export const HandConnectionSchema = z.object({
   ha: HandSchema,
   b: DancerIdSchema,
   hb: HandSchema,
-});
+}).readonly();
+/** Like dancer states, hand connections are shared between keyframes and never mutated. */
 export type HandConnection = z.infer<typeof HandConnectionSchema>;
 
 export const KeyframeSchema = z.object({